@@ -6,10 +6,23 @@ Usage:
     python factorial.py
 
 Enter a non-negative integer to compute its factorial, or 'q' to quit.
+Large inputs are computed with the prime-swing engine in fast_factorial.py;
+the recursive and iterative versions are kept for comparison on small n.
 """
 
+import math
+import sys
 from typing import Optional
 
+from fast_factorial import factorial
+
+
+# Above this n only the fast engine is used (the recursive version would hit
+# the recursion limit and the iterative one is quadratic in the digit count).
+COMPARE_LIMIT = 500
+
+LOG10_2 = math.log10(2)
+
 
 # Recursive factorial implementation
 # Function to compute factorial recursively
@@ -74,7 +87,19 @@ def main() -> None:
             print("Please enter a non-negative integer (n >= 0).")
             continue
 
-        # compute both ways
+        result = factorial(n)
+        # str() refuses ints with more digits than sys.get_int_max_str_digits()
+        # (4300 by default, reached at 1559!; 0 means no limit), so past that report the size
+        digit_limit = sys.get_int_max_str_digits() if hasattr(sys, 'get_int_max_str_digits') else 0
+        if digit_limit and result.bit_length() * LOG10_2 >= digit_limit:
+            print(f"{n}! is a {result.bit_length()}-bit integer (computed with prime-swing).")
+            continue
+
+        print(f"{n}! = {result}")
+        if n > COMPARE_LIMIT:
+            continue
+
+        # compute both ways for comparison with the fast engine
         try:
             rec = factorial_recursive(n)
             itr = factorial_iterative(n)
@@ -85,8 +110,8 @@ def main() -> None:
             continue
 
         # sanity check
-        if rec != itr:
-            print("Warning: recursive and iterative results differ (unexpected).")
+        if not rec == itr == result:
+            print("Warning: factorial implementations differ (unexpected).")
 
         print(f"{n}! (recursive) = {rec}")
         print(f"{n}! (iterative) = {itr}")
@@ -0,0 +1,146 @@
+# fast_factorial.py
+"""
+Big-integer factorial engine shared by the factorial tool (Assignment 1) and
+the recursive factorial demo (Assignment 18).
+
+factorial(n) uses Luschny's prime-swing algorithm: n! = swing(n) * (n//2)!**2,
+where swing(n) is assembled from prime powers and multiplied with a balanced
+product tree, so the big multiplications always combine similarly sized
+operands. Recursion depth is O(log n), so there is no recursion limit issue.
+
+Usage:
+    python fast_factorial.py        # run the benchmark against math.factorial
+"""
+
+import math
+import time
+from typing import Dict, List, Sequence
+
+from primality import primes_in_range
+
+# Below this n the plain loop is faster than sieving for primes.
+_SMALL_LIMIT = 64
+
+
+def _product(values: Sequence[int], lo: int, hi: int) -> int:
+    """Return the product of values[lo:hi] by binary splitting."""
+    if hi - lo <= 8:
+        result = 1
+        for v in values[lo:hi]:
+            result *= v
+        return result
+    mid = (lo + hi) // 2
+    return _product(values, lo, mid) * _product(values, mid, hi)
+
+
+def _swing(n: int, primes: List[int]) -> int:
+    """Return the swinging factorial n! / ((n//2)!)**2 from the primes <= n."""
+    root = math.isqrt(n)
+    factors: List[int] = []
+    for p in primes:
+        if p > n:
+            break
+        if p <= root:
+            # multiplicity of p in swing(n) is the number of odd quotients
+            q, power = n, 1
+            while True:
+                q //= p
+                if q == 0:
+                    break
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+        elif p <= n // 3:
+            if (n // p) & 1:
+                factors.append(p)
+        elif p > n // 2:
+            factors.append(p)
+    return _product(factors, 0, len(factors))
+
+
+def _factorial_loop(n: int) -> int:
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def factorial(n: int) -> int:
+    """Return n! using the prime-swing algorithm.
+
+    Raises ValueError for negative inputs.
+    """
+    if n < 0:
+        raise ValueError("factorial is not defined for negative integers")
+    if n < _SMALL_LIMIT:
+        return _factorial_loop(n)
+    primes = primes_in_range(2, n + 1)
+
+    def rec(k: int) -> int:
+        if k < _SMALL_LIMIT:
+            return _factorial_loop(k)
+        half = rec(k // 2)
+        return half * half * _swing(k, primes)
+
+    return rec(n)
+
+
+def factorial_mod(n: int, m: int) -> int:
+    """Return n! mod m without building the full big integer.
+
+    Uses Legendre's formula for the exponent of each prime p <= n, so the
+    cost is one modular exponentiation per prime. Raises ValueError for
+    negative n or non-positive m.
+    """
+    if n < 0:
+        raise ValueError("factorial is not defined for negative integers")
+    if m <= 0:
+        raise ValueError("modulus must be a positive integer")
+    if m == 1 or n >= m:
+        # m divides n! whenever n >= m
+        return 0
+    result = 1
+    for p in primes_in_range(2, n + 1):
+        e, q = 0, n
+        while q:
+            q //= p
+            e += q
+        result = result * pow(p, e, m) % m
+    return result
+
+
+def benchmark(sizes: Sequence[int] = (1000, 10_000, 100_000, 300_000)) -> Dict[int, Dict[str, float]]:
+    """Time factorial against math.factorial and the naive loop.
+
+    The naive loop is skipped above 100_000 where it takes too long to be
+    useful. Returns {n: {name: seconds}}.
+    """
+    results: Dict[int, Dict[str, float]] = {}
+    for n in sizes:
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        ours = factorial(n)
+        timings['prime_swing'] = time.perf_counter() - start
+        start = time.perf_counter()
+        ref = math.factorial(n)
+        timings['math.factorial'] = time.perf_counter() - start
+        if n <= 100_000:
+            start = time.perf_counter()
+            _factorial_loop(n)
+            timings['loop'] = time.perf_counter() - start
+        if ours != ref:
+            raise AssertionError(f"factorial({n}) disagrees with math.factorial")
+        results[n] = timings
+    return results
+
+
+def main() -> None:
+    print("Factorial benchmark (seconds):")
+    for n, timings in benchmark().items():
+        row = ', '.join(f"{name}={secs:.4f}" for name, secs in timings.items())
+        print(f"  n={n:>7}: {row}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,9 +7,24 @@ Usage:
 
 Enter numbers separated by commas or spaces (e.g. "1, 3, 2" or "1 3 2").
 Enter 'q' to quit.
+
+Streaming mode (bounded memory, for large metric dumps):
+    python largest_in_list.py --file numbers.txt --top 10
+    cat numbers.txt | python largest_in_list.py --stdin
 """
 
-from typing import List, Union, Optional
+import argparse
+import heapq
+import sys
+from typing import IO, Iterator, List, Union, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the heap path works without it
+    np = None
+
+# Characters read per chunk in streaming mode.
+CHUNK_SIZE = 1 << 20
 
 # Function to find the largest number in a list
 # (Copilot-style completion would often produce a simple loop like below)
@@ -63,7 +78,96 @@ def parse_numbers(s: str) -> Optional[List[float]]:
     return nums
 
 
+def iter_number_chunks(stream: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[List[float]]:
+    """Yield lists of numbers parsed from stream, one list per chunk read.
+
+    Accepts the same comma/whitespace separators as parse_numbers. A number
+    split across two chunks is carried over, so memory stays at one chunk.
+    Raises ValueError on a token that is not a number.
+    """
+    carry = ''
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        text = carry + block.replace(',', ' ')
+        tokens = text.split()
+        # the last token may continue in the next chunk unless text ends on a separator
+        carry = tokens.pop() if tokens and not text[-1].isspace() else ''
+        if tokens:
+            yield [float(t) for t in tokens]
+    if carry:
+        yield [float(carry)]
+
+
+def stream_top_k(stream: IO[str], k: int = 1, chunk_size: int = CHUNK_SIZE) -> List[float]:
+    """Return the k largest numbers in stream, largest first.
+
+    Keeps a min-heap of at most k items, so memory is O(k + chunk). When NumPy
+    is available each chunk is first reduced to its own top k with
+    argpartition, so only k candidates per chunk reach the Python heap.
+    Raises ValueError if k < 1 or the stream contains no numbers.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    heap: List[float] = []
+    for chunk in iter_number_chunks(stream, chunk_size):
+        if np is not None and len(chunk) > k:
+            arr = np.asarray(chunk, dtype=np.float64)
+            chunk = arr[np.argpartition(arr, len(arr) - k)[-k:]].tolist()
+        for x in chunk:
+            if len(heap) < k:
+                heapq.heappush(heap, x)
+            elif x > heap[0]:
+                heapq.heapreplace(heap, x)
+    if not heap:
+        raise ValueError("empty list")
+    return sorted(heap, reverse=True)
+
+
+def stream_max(stream: IO[str], chunk_size: int = CHUNK_SIZE) -> float:
+    """Return the largest number in stream without materializing it."""
+    largest: Optional[float] = None
+    for chunk in iter_number_chunks(stream, chunk_size):
+        m = max(chunk)
+        if largest is None or m > largest:
+            largest = m
+    if largest is None:
+        raise ValueError("empty list")
+    return largest
+
+
+def run_stream(stream: IO[str], k: int) -> None:
+    """Print the max (k == 1) or top-k numbers of stream."""
+    try:
+        if k == 1:
+            print(f"Largest (streaming) = {stream_max(stream)}")
+        else:
+            top = stream_top_k(stream, k)
+            print(f"Top {len(top)} (streaming) = {', '.join(str(x) for x in top)}")
+    except ValueError as exc:
+        print(f"Error: {exc}")
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description='Find the largest numbers in a list or stream.')
+    parser.add_argument('--file', type=str, help='Stream numbers from this file')
+    parser.add_argument('--stdin', action='store_true', help='Stream numbers from standard input')
+    parser.add_argument('--top', type=int, default=1, help='Report the k largest numbers (default 1)')
+    args = parser.parse_args()
+
+    if args.file:
+        try:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                run_stream(f, args.top)
+        except OSError as exc:
+            print(f"Error: {exc}")
+        return
+
+    if args.stdin:
+        run_stream(sys.stdin, args.top)
+        return
+
     print("Largest-in-list tool. Enter numbers separated by commas or spaces, or 'q' to quit.")
     while True:
         try:
@@ -0,0 +1,228 @@
+# primality.py
+"""
+Shared primality engine used by the prime checker (Assignment 1) and the
+lab test solution (lab_test_1/Q1.py).
+
+Provides:
+    is_prime(n)              scalar test (trial division / Miller-Rabin)
+    primes_in_range(lo, hi)  segmented sieve
+    is_prime_many(values)    batch test reusing one sieve per dense group
+    is_prime_array(arr)      NumPy fast path returning a boolean mask
+"""
+
+import math
+import time
+from typing import Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only is_prime_array needs it
+    np = None
+
+
+# Deterministic Miller-Rabin bases: testing against the first 12 primes is
+# exact for every n < 3.3 * 10**24, which covers all 64-bit integers.
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Below this bound plain trial division is cheaper than Miller-Rabin.
+_TRIAL_LIMIT = 1 << 20
+
+# Flags sieved at a time by primes_in_range (small enough to stay in cache).
+_SEGMENT_SIZE = 1 << 18
+
+
+def _simple_sieve(limit: int) -> bytearray:
+    """Return a bytearray where flags[i] == 1 iff i is prime, for 0 <= i <= limit."""
+    flags = bytearray([1]) * (limit + 1)
+    flags[0:2] = b'\x00\x00'[:limit + 1]
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return flags
+
+
+def _is_prime_trial(n: int) -> bool:
+    """Trial division by odd divisors up to sqrt(n); assumes n >= 5 and odd."""
+    limit = int(math.isqrt(n))
+    for i in range(3, limit + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+
+def _is_prime_miller_rabin(n: int) -> bool:
+    """Deterministic Miller-Rabin test; assumes n is odd and > max(_MR_BASES)."""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n: int) -> bool:
+    """Return True if n is a prime number, False otherwise.
+
+    Small inputs use trial division; larger ones use a deterministic
+    Miller-Rabin test that is exact for all 64-bit integers (and well beyond),
+    so even 18-digit inputs are answered in microseconds. Handles n < 2 as
+    non-prime.
+    """
+    if n < 2:
+        return False
+    if n in (2, 3):
+        return True
+    if n % 2 == 0:
+        return False
+    if n < _TRIAL_LIMIT:
+        return _is_prime_trial(n)
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    return _is_prime_miller_rabin(n)
+
+
+def primes_in_range(lo: int, hi: int, segment_size: int = _SEGMENT_SIZE) -> List[int]:
+    """Return all primes p with lo <= p < hi using a segmented sieve.
+
+    Besides the result, only the base primes up to sqrt(hi) and one
+    bytearray segment of at most segment_size flags are held in memory;
+    the range is sieved one segment at a time.
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return []
+    flags = _simple_sieve(math.isqrt(hi - 1))
+    base = [p for p in range(2, len(flags)) if flags[p]]
+    primes = []
+    for seg_lo in range(lo, hi, segment_size):
+        seg_hi = min(seg_lo + segment_size, hi)
+        segment = bytearray([1]) * (seg_hi - seg_lo)
+        for p in base:
+            start = max(p * p, (seg_lo + p - 1) // p * p)
+            if start >= seg_hi:
+                if p * p >= seg_hi:
+                    break
+                continue
+            segment[start - seg_lo::p] = bytes(len(range(start, seg_hi, p)))
+        primes.extend(seg_lo + i for i, flag in enumerate(segment) if flag)
+    return primes
+
+
+def is_prime_many(values: Iterable[int], max_span: int = 1 << 24) -> List[bool]:
+    """Classify many integers at once, preserving input order.
+
+    Inputs are sorted so that values packed into a dense window share one
+    segmented sieve; anything outside such a window (or too sparse to be worth
+    sieving) falls back to is_prime. max_span bounds the sieve size in bytes.
+    """
+    values = list(values)
+    results = [False] * len(values)
+    order = sorted(range(len(values)), key=values.__getitem__)
+    i = 0
+    while i < len(order):
+        lo = values[order[i]]
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] - lo < max_span:
+            j += 1
+        hi = values[order[j]] + 1
+        count = j - i + 1
+        # a sieve costs roughly (hi - lo) + sqrt(hi) byte operations, so it is
+        # only worth it for dense groups of moderately sized values
+        if count > 1 and hi > 2 and (hi - lo) + math.isqrt(hi) <= count * 64:
+            primes = set(primes_in_range(lo, hi))
+            for k in order[i:j + 1]:
+                results[k] = values[k] in primes
+        else:
+            for k in order[i:j + 1]:
+                results[k] = is_prime(values[k])
+        i = j + 1
+    return results
+
+
+# Table size for the vectorized path: values below this are answered by a
+# direct lookup, larger ones are filtered by the wheel and small primes first.
+_TABLE_LIMIT = 1 << 16
+_WHEEL = 30
+_WHEEL_RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+# Primes 7..997 used to knock out most wheel survivors before Miller-Rabin.
+_FILTER_PRIMES = tuple(p for p in range(7, 1000) if _is_prime_trial(p))
+
+_table = None
+_wheel_mask = None
+
+
+def _vector_tables():
+    """Build (once) the small-prime lookup table and the wheel-30 residue mask."""
+    global _table, _wheel_mask
+    if _table is None:
+        _table = np.frombuffer(bytes(_simple_sieve(_TABLE_LIMIT - 1)), dtype=np.bool_)
+        wheel = np.zeros(_WHEEL, dtype=np.bool_)
+        wheel[list(_WHEEL_RESIDUES)] = True
+        _wheel_mask = wheel
+    return _table, _wheel_mask
+
+
+def is_prime_array(values) -> "np.ndarray":
+    """Return a boolean mask marking the primes in an int64 array.
+
+    Values below _TABLE_LIMIT are looked up in a precomputed sieve table.
+    Larger values are filtered with the wheel-30 residues and divisibility by
+    the small primes, all as array operations; only the few survivors are
+    handed to the scalar Miller-Rabin test. Raises RuntimeError if NumPy is
+    not installed.
+    """
+    if np is None:
+        raise RuntimeError("is_prime_array requires NumPy; use is_prime_many instead")
+    arr = np.asarray(values, dtype=np.int64)
+    table, wheel = _vector_tables()
+    mask = np.zeros(arr.shape, dtype=np.bool_)
+
+    small = (arr >= 0) & (arr < _TABLE_LIMIT)
+    mask[small] = table[arr[small]]
+
+    idx = np.flatnonzero((arr >= _TABLE_LIMIT).ravel())
+    cand = arr.ravel()[idx]
+    keep = wheel[cand % _WHEEL]
+    idx, cand = idx[keep], cand[keep]
+    for p in _FILTER_PRIMES:
+        keep = cand % p != 0
+        idx, cand = idx[keep], cand[keep]
+        if not cand.size:
+            break
+    flat = mask.reshape(-1)
+    flat[idx] = [_is_prime_miller_rabin(int(n)) for n in cand]
+    return mask
+
+
+def benchmark(cases: Iterable[int], repeat: int = 2000) -> dict:
+    """Time per-element is_prime against is_prime_array over cases * repeat.
+
+    Returns a dict with the element count and elements/second for each path
+    (the vectorized entry is None when NumPy is unavailable).
+    """
+    values = list(cases) * repeat
+    start = time.perf_counter()
+    scalar = [is_prime(n) for n in values]
+    scalar_time = time.perf_counter() - start
+    result = {'elements': len(values), 'scalar_per_sec': len(values) / scalar_time,
+              'vector_per_sec': None}
+    if np is not None:
+        arr = np.array(values, dtype=np.int64)
+        start = time.perf_counter()
+        vector = is_prime_array(arr)
+        vector_time = time.perf_counter() - start
+        if vector.tolist() != scalar:
+            raise AssertionError("vectorized and scalar results differ")
+        result['vector_per_sec'] = len(values) / vector_time
+    return result
@@ -8,28 +8,7 @@ Usage:
 Enter an integer to check if it's prime, or 'q' to quit.
 """
 
-import math
-import sys
-
-
-def is_prime(n: int) -> bool:
-    """Return True if n is a prime number, False otherwise.
-
-    Uses a simple deterministic algorithm suitable for integers up to at least
-    2**31-1. Handles n < 2 as non-prime.
-    """
-    if n < 2:
-        return False
-    if n in (2, 3):
-        return True
-    if n % 2 == 0:
-        return False
-    # test odd divisors up to sqrt(n)
-    limit = int(math.isqrt(n))
-    for i in range(3, limit + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+from primality import is_prime
 
 
 def main() -> None:
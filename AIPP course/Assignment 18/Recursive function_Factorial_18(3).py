@@ -1,8 +1,25 @@
-def factorial(n):
-    if n == 0:
-        return 1
-    else:
-        return n * factorial(n - 1)
+import os
+import sys
+
+# Use the shared prime-swing engine instead of plain recursion, which hit the
+# recursion limit near n=1000.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'Assignment 1'))
+from fast_factorial import factorial
+
+
+def factorial_text(n):
+    """Decimal digits of n!, lifting the int-to-str digit limit only for this call."""
+    value = factorial(n)
+    if not hasattr(sys, 'get_int_max_str_digits'):
+        return str(value)
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        return str(value)
+    finally:
+        sys.set_int_max_str_digits(limit)
+
 
 print("--- Python Factorial Calls ---")
 user_input = input("Enter a non-negative integer to calculate its factorial: ")
@@ -11,6 +28,6 @@ try:
     if num_to_factorialize < 0:
         print("Factorial is not defined for negative numbers.")
     else:
-        print(f"Factorial of {num_to_factorialize} = {factorial(num_to_factorialize)}")
+        print(f"Factorial of {num_to_factorialize} = {factorial_text(num_to_factorialize)}")
 except ValueError:
     print("Invalid input. Please enter an integer.")
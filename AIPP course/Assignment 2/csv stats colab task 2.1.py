@@ -1,18 +1,162 @@
 # csv_stats_colab.py
 # Colab-ready function to read a CSV and compute mean/min/max for numeric columns.
 # This file can be run locally or its function can be imported into a Colab notebook.
+# Pass chunksize=N to stream large files with bounded memory, or use
+# compute_stats_many() to aggregate many CSV shards across processes.
 
 import io
+import math
+import os
 import sys
 import subprocess
-from typing import List, Optional, Dict, Any, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Dict, Any, Union
 
-# Ensure pandas is available (Colab already has it, but this is safe for local runs)
+# pandas is imported lazily-installed: the pip fallback only runs the first time
+# a stats function is called without pandas present, never at import time.
 try:
     import pandas as pd
 except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pandas"])
-    import pandas as pd
+    pd = None
+
+
+def _require_pandas():
+    """Return the pandas module, installing it first if missing (Colab already has it)."""
+    global pd
+    if pd is None:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pandas"])
+        import pandas
+        pd = pandas
+    return pd
+
+
+class RunningStats:
+    """Running count/sum/min/max for one column, with optional Welford M2.
+
+    Chunks are folded in with update(); two instances combine with merge()
+    using Chan's parallel form of Welford's algorithm, so the variance is
+    numerically stable without keeping the data around.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.m2 = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float("nan")
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1), matching pandas' default."""
+        return self.m2 / (self.count - 1) if self.count > 1 else float("nan")
+
+    def update(self, values: "pd.Series", track_variance: bool = False) -> None:
+        """Fold a numeric Series into the running totals (NaNs are skipped)."""
+        values = values.dropna()
+        n = len(values)
+        if not n:
+            return
+        chunk = RunningStats()
+        chunk.count = n
+        chunk.total = float(values.sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        if track_variance:
+            chunk.m2 = float(((values - chunk.total / n) ** 2).sum())
+        self.merge(chunk)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Combine other into self in place and return self."""
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.total, self.m2 = other.count, other.total, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+
+def _resolve_columns(header: List[Any], columns: Optional[List[Any]]) -> Optional[List[Any]]:
+    """Map 0-based column indices to names and check that named columns exist."""
+    if columns is not None and all(isinstance(c, int) for c in columns):
+        max_idx = len(header) - 1
+        cols_by_index = []
+        for idx in columns:
+            if idx < 0 or idx > max_idx:
+                raise ValueError(f"Column index {idx} out of range (0..{max_idx})")
+            cols_by_index.append(header[idx])
+        columns = cols_by_index
+
+    if columns is not None:
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise ValueError(f"Specified columns missing from CSV: {missing}")
+    return columns
+
+
+def _format_stats(
+    stats: Dict[Any, RunningStats], include_variance: bool, return_dataframe: bool
+) -> Union["pd.DataFrame", Dict[str, Dict[str, float]]]:
+    """Shape running stats like the in-memory result (DataFrame or dict)."""
+    stats = {col: st for col, st in stats.items() if st.count}
+    if not stats:
+        raise ValueError("No numeric data found in the selected columns or file.")
+
+    out: Dict[str, Dict[str, float]] = {}
+    for col, st in stats.items():
+        out[col] = {"mean": st.mean, "min": st.min, "max": st.max}
+        if include_variance:
+            out[col]["var"] = st.variance
+    if return_dataframe:
+        return pd.DataFrame(out)
+    return out
+
+
+def _stream_csv_stats(
+    file: Union[str, io.BytesIO],
+    columns: Optional[List[Any]],
+    delimiter: str,
+    na_values: Optional[List[str]],
+    skiprows: int,
+    chunksize: int,
+    include_variance: bool,
+) -> Dict[Any, RunningStats]:
+    """Read file in chunks of chunksize rows and return per-column RunningStats.
+
+    Only one chunk is held in memory at a time. Undecodable bytes are replaced
+    in the stream itself instead of re-reading the file into memory.
+    """
+    reader = pd.read_csv(
+        file,
+        delimiter=delimiter,
+        na_values=na_values,
+        skiprows=skiprows,
+        chunksize=chunksize,
+        encoding_errors="replace",
+    )
+    stats: Dict[Any, RunningStats] = {}
+    selected: Optional[List[Any]] = None
+    with reader:
+        for chunk in reader:
+            if selected is None:
+                selected = _resolve_columns(list(chunk.columns), columns) or list(chunk.columns)
+                stats = {col: RunningStats() for col in selected}
+            for col in selected:
+                stats[col].update(pd.to_numeric(chunk[col], errors="coerce"), include_variance)
+    return stats
 
 
 def read_csv_compute_stats(
@@ -22,7 +166,9 @@ def read_csv_compute_stats(
     na_values: Optional[List[str]] = None,
     skiprows: int = 0,
     return_dataframe: bool = True,
-) -> Union[pd.DataFrame, Dict[str, Dict[str, float]]]:
+    chunksize: Optional[int] = None,
+    include_variance: bool = False,
+) -> Union["pd.DataFrame", Dict[str, Dict[str, float]]]:
     """
     Read a CSV and compute mean, min, max for numeric columns.
 
@@ -33,6 +179,10 @@ def read_csv_compute_stats(
       na_values: Additional strings to treat as NaN.
       skiprows: Number of rows to skip before the header.
       return_dataframe: If True returns a pandas DataFrame (rows: mean,min,max). If False returns a dict.
+      chunksize: If given, stream the file this many rows at a time and keep running
+        statistics, so peak memory is bounded by one chunk regardless of file size.
+      include_variance: Also report the sample variance ('var' row), computed with Welford's
+        algorithm in streaming mode.
 
     Returns:
       pandas.DataFrame or dict mapping column -> {'mean','min','max'}.
@@ -41,6 +191,13 @@ def read_csv_compute_stats(
       FileNotFoundError if file path doesn't exist.
       ValueError if no numeric data found in the selected columns.
     """
+    _require_pandas()
+    if chunksize is not None:
+        stats = _stream_csv_stats(
+            file, columns, delimiter, na_values, skiprows, chunksize, include_variance
+        )
+        return _format_stats(stats, include_variance, return_dataframe)
+
     # Read csv into DataFrame robustly
     try:
         df = pd.read_csv(file, delimiter=delimiter, na_values=na_values, skiprows=skiprows)
@@ -54,24 +211,18 @@ def read_csv_compute_stats(
                 content = content.decode("utf-8", errors="replace")
             df = pd.read_csv(io.StringIO(content), delimiter=delimiter, na_values=na_values)
         else:
-            with open(file, "r", encoding="utf-8", errors="replace") as f:
-                df = pd.read_csv(io.StringIO(f.read()), delimiter=delimiter, na_values=na_values)
+            # Replace bad bytes while parsing instead of copying the whole file into memory
+            df = pd.read_csv(
+                file,
+                delimiter=delimiter,
+                na_values=na_values,
+                skiprows=skiprows,
+                encoding_errors="replace",
+            )
 
-    # If columns are indices, map to names
-    if columns is not None and all(isinstance(c, int) for c in columns):
-        max_idx = len(df.columns) - 1
-        cols_by_index = []
-        for idx in columns:
-            if idx < 0 or idx > max_idx:
-                raise ValueError(f"Column index {idx} out of range (0..{max_idx})")
-            cols_by_index.append(df.columns[idx])
-        columns = cols_by_index
-
-    # Select given columns if provided
+    # Map indices to names, validate, and select given columns if provided
+    columns = _resolve_columns(list(df.columns), columns)
     if columns is not None:
-        missing = [c for c in columns if c not in df.columns]
-        if missing:
-            raise ValueError(f"Specified columns missing from CSV: {missing}")
         df = df[columns]
 
     # Try coercing every column to numeric (non-convertible -> NaN)
@@ -83,7 +234,8 @@ def read_csv_compute_stats(
         raise ValueError("No numeric data found in the selected columns or file.")
 
     # Compute stats
-    stats = numeric_df.agg(["mean", "min", "max"])
+    aggs = ["mean", "min", "max"] + (["var"] if include_variance else [])
+    stats = numeric_df.agg(aggs)
 
     if return_dataframe:
         return stats
@@ -95,9 +247,72 @@ def read_csv_compute_stats(
                 "min": float(stats.loc["min", col]) if pd.notna(stats.loc["min", col]) else float("nan"),
                 "max": float(stats.loc["max", col]) if pd.notna(stats.loc["max", col]) else float("nan"),
             }
+            if include_variance:
+                var = stats.loc["var", col]
+                out[col]["var"] = float(var) if pd.notna(var) else float("nan")
         return out
 
 
+def _shard_stats(job: tuple) -> Dict[Any, RunningStats]:
+    """Process-pool worker: return the mergeable partial aggregates for one shard."""
+    _require_pandas()
+    return _stream_csv_stats(*job)
+
+
+def compute_stats_many(
+    paths: Iterable[str],
+    columns: Optional[List[Any]] = None,
+    delimiter: str = ",",
+    na_values: Optional[List[str]] = None,
+    skiprows: int = 0,
+    return_dataframe: bool = True,
+    include_variance: bool = False,
+    workers: Optional[int] = None,
+    chunksize: int = 100_000,
+) -> Union["pd.DataFrame", Dict[str, Dict[str, float]]]:
+    """
+    Compute mean, min, max (and optionally variance) over many CSV shards.
+
+    Each shard is streamed by a worker process into per-column RunningStats
+    (count, sum, min, max, M2); the partial aggregates are then merged into one
+    global table. The result has the same shape as read_csv_compute_stats.
+
+    Args:
+      paths: CSV file paths, all sharing the same header.
+      workers: Number of worker processes (default: os.cpu_count()). 1 runs in-process.
+      chunksize: Rows per chunk read inside each worker.
+      Other arguments are as for read_csv_compute_stats.
+
+    Raises:
+      ValueError if no paths are given or no numeric data is found.
+    """
+    _require_pandas()
+    paths = list(paths)
+    if not paths:
+        raise ValueError("No CSV paths given.")
+    jobs = [
+        (path, columns, delimiter, na_values, skiprows, chunksize, include_variance)
+        for path in paths
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        partials = map(_shard_stats, jobs)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        partials = pool.map(_shard_stats, jobs)
+
+    try:
+        # Merge in shard order so columns keep their first-seen order
+        merged: Dict[Any, RunningStats] = {}
+        for partial in partials:
+            for col, st in partial.items():
+                merged.setdefault(col, RunningStats()).merge(st)
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    return _format_stats(merged, include_variance, return_dataframe)
+
+
 if __name__ == "__main__":
     # Small demo: create sample CSV and run stats
     sample_csv = """id,value_a,value_b,notes
@@ -116,3 +331,9 @@ if __name__ == "__main__":
 
     print("\nAs JSON-friendly dict:\n")
     print(read_csv_compute_stats("sample.csv", return_dataframe=False))
+
+    print("\nStreaming in 2-row chunks, with variance:\n")
+    print(read_csv_compute_stats("sample.csv", chunksize=2, include_variance=True))
+
+    print("\nSame file treated as two shards across worker processes:\n")
+    print(compute_stats_many(["sample.csv", "sample.csv"], workers=2))
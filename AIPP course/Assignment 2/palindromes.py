@@ -0,0 +1,193 @@
+# palindromes.py
+"""
+Fast palindrome utilities for checking large inputs (whole files of lines).
+
+- normalize() strips everything except ASCII letters/digits and lowercases in
+  one bytes.translate pass (no regex, no per-character Python loop).
+- is_palindrome() compares the two halves of the normalized text.
+- longest_palindromic_substring() is Manacher's O(n) algorithm.
+- check_lines() / count_palindromes() stream a file line by line through a
+  generator pipeline, so millions of lines use constant memory.
+
+Usage:
+    python palindromes.py --file lines.txt        # count palindromic lines
+    python palindromes.py --longest "abacdfgdcaba"
+    python palindromes.py --benchmark
+"""
+
+import argparse
+import re
+import string
+import time
+from typing import Iterable, Iterator, List, Tuple, Union
+
+_ASCII = bytes(range(256))
+# Maps A-Z to a-z; applied together with a deletion set by bytes.translate.
+_LOWER = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+_DELETE_NON_ALNUM = bytes(b for b in _ASCII if not chr(b).isascii() or not chr(b).isalnum())
+_DELETE_NON_ALPHA = bytes(b for b in _ASCII if not chr(b).isascii() or not chr(b).isalpha())
+
+
+def normalize(s: Union[str, bytes], keep_digits: bool = True) -> bytes:
+    """Return s lowercased with everything but ASCII letters (and digits) removed.
+
+    keep_digits=False matches Assignment 8's letters-only sentence check.
+    Non-ASCII characters are dropped, as in the regex-based versions.
+    """
+    if isinstance(s, str):
+        s = s.encode('ascii', 'ignore')
+    return s.translate(_LOWER, _DELETE_NON_ALNUM if keep_digits else _DELETE_NON_ALPHA)
+
+
+def _is_palindrome_normalized(b: bytes) -> bool:
+    half = len(b) // 2
+    # compare first half with the reversed second half instead of reversing all of b
+    return b[:half] == b[len(b) - 1:len(b) - 1 - half:-1] if half else True
+
+
+def is_palindrome(s: Union[str, bytes, None], keep_digits: bool = True) -> bool:
+    """Return True if s reads the same backwards after normalize()."""
+    if s is None:
+        return False
+    return _is_palindrome_normalized(normalize(s, keep_digits))
+
+
+def longest_palindromic_substring(s: str) -> str:
+    """Return the longest palindromic substring of s (first one on ties).
+
+    Manacher's algorithm over the '#'-interleaved string: O(n) time and space.
+    """
+    if not s:
+        return ""
+    t = '#' + '#'.join(s) + '#'
+    n = len(t)
+    radius = [0] * n
+    center = right = 0
+    best_len = best_center = 0
+    for i in range(n):
+        if i < right:
+            radius[i] = min(right - i, radius[2 * center - i])
+        # expand around i
+        r = radius[i]
+        while i - r - 1 >= 0 and i + r + 1 < n and t[i - r - 1] == t[i + r + 1]:
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center, right = i, i + r
+        if r > best_len:
+            best_len, best_center = r, i
+    start = (best_center - best_len) // 2
+    return s[start:start + best_len]
+
+
+def check_lines(lines: Iterable[bytes], keep_digits: bool = True) -> Iterator[Tuple[bytes, bool]]:
+    """Yield (line, is_palindrome) for each line, with the line ending stripped."""
+    delete = _DELETE_NON_ALNUM if keep_digits else _DELETE_NON_ALPHA
+    for line in lines:
+        line = line.rstrip(b'\r\n')
+        yield line, _is_palindrome_normalized(line.translate(_LOWER, delete))
+
+
+def iter_file_lines(path: str, buffer_size: int = 1 << 20) -> Iterator[bytes]:
+    """Yield raw lines from path using a large read buffer (no decoding)."""
+    with open(path, 'rb', buffering=buffer_size) as f:
+        yield from f
+
+
+def count_palindromes(path: str, keep_digits: bool = True) -> Tuple[int, int]:
+    """Return (palindromic_lines, total_lines) for the file at path."""
+    total = hits = 0
+    for _, ok in check_lines(iter_file_lines(path), keep_digits):
+        total += 1
+        hits += ok
+    return hits, total
+
+
+# Reference copies of the existing implementations, kept for the benchmark
+# (the original scripts run interactive prompts at import time).
+def _reference_gemini(s: str) -> bool:
+    cleaned = re.sub(r"[^A-Za-z0-9]", "", s).lower()
+    return cleaned == cleaned[::-1]
+
+
+def _reference_copilot(s: str) -> bool:
+    s = ''.join(ch.lower() for ch in s if ch.isalnum())
+    return s == s[::-1]
+
+
+def _reference_sentence(sentence: str) -> bool:
+    s = re.sub(r'[^a-z]', '', sentence.lower())
+    return s == s[::-1]
+
+
+def benchmark(lines: List[str], repeat: int = 3) -> List[Tuple[str, float]]:
+    """Time each implementation over lines; return (name, lines/second) pairs."""
+    encoded = [line.encode('utf-8') for line in lines]
+    candidates = [
+        ('gemini_palindrome (re.sub)', lambda: [_reference_gemini(s) for s in lines]),
+        ('is_palindrome_copilot (join)', lambda: [_reference_copilot(s) for s in lines]),
+        ('is_sentence_palindrome (re.sub)', lambda: [_reference_sentence(s) for s in lines]),
+        ('is_palindrome (translate)', lambda: [is_palindrome(s) for s in lines]),
+        ('check_lines (bytes pipeline)', lambda: [ok for _, ok in check_lines(encoded)]),
+    ]
+    results = []
+    for name, run in candidates:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        results.append((name, len(lines) / best))
+    return results
+
+
+def run_tests() -> None:
+    assert is_palindrome("A man, a plan, a canal: Panama")
+    assert not is_palindrome("race a car")
+    assert is_palindrome("")
+    assert not is_palindrome(None)
+    assert is_palindrome("No 'x' in Nixon")
+    assert is_palindrome("12321") and not is_palindrome("123")
+    assert is_palindrome("ab1ba2", keep_digits=False)
+    assert longest_palindromic_substring("babad") == "bab"
+    assert longest_palindromic_substring("cbbd") == "bb"
+    assert longest_palindromic_substring("forgeeksskeegfor") == "geeksskeeg"
+    assert longest_palindromic_substring("a") == "a"
+    assert list(check_lines([b"Madam\n", b"hello\r\n"])) == [(b"Madam", True), (b"hello", False)]
+    for s in ["Was it a car or a cat I saw?", "hello", "Ünïcödé ëdocinü", "Ab!ba", ""]:
+        assert is_palindrome(s) == _reference_gemini(s)
+        assert is_palindrome(s, keep_digits=False) == _reference_sentence(s)
+    print('All tests passed.')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Fast palindrome checks.')
+    parser.add_argument('--file', type=str, help='Count palindromic lines in this file')
+    parser.add_argument('--letters-only', action='store_true', help='Ignore digits when normalizing')
+    parser.add_argument('--longest', type=str, help='Print the longest palindromic substring of this text')
+    parser.add_argument('--benchmark', action='store_true', help='Compare against the existing implementations')
+    parser.add_argument('--test', action='store_true', help='Run self-tests')
+    args = parser.parse_args()
+
+    if args.test:
+        run_tests()
+    elif args.longest is not None:
+        print(f'Longest palindrome: {longest_palindromic_substring(args.longest)!r}')
+    elif args.file:
+        try:
+            hits, total = count_palindromes(args.file, keep_digits=not args.letters_only)
+        except OSError as exc:
+            print(f'Error: {exc}')
+            return
+        print(f'{hits} of {total} lines are palindromes.')
+    elif args.benchmark:
+        sample = ["A man, a plan, a canal: Panama", "race a car", "Was it a car or a cat I saw?",
+                  "hello world, this is not a palindrome at all"] * 50_000
+        for name, rate in benchmark(sample):
+            print(f'  {name:<34} {rate:>12,.0f} lines/s')
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,7 @@ TGNPDCL Bill Generator
 Interactive CLI with optional command-line args.
 
 Inputs:
- - PU: Price per unit (float)
+ - PU: Price per unit (float); leave blank to use the slab (telescopic) tariff
  - CU: Consumption units (float)
  - type: customer type (domestic/commercial/industrial)
 Optional overrides:
@@ -13,33 +13,99 @@ Optional overrides:
  - ED: Electricity Duty percent
 
 Calculation:
- EC = PU * CU
+ EC = PU * CU                (flat rate), or
+ EC = sum over slabs of units_in_slab * slab_rate   (slab tariff, when PU is blank)
  subtotal = EC + FC + CC
  ED_amount = subtotal * ED/100
  total_bill = subtotal + ED_amount
 
 Outputs printed: EC, FC, CC, ED (amount and %), Total Bill
 
+Single bill without prompts:
+ python tgnpdcl_bill.py --cu 250 --type domestic [--pu 5] [--fc ..] [--cc ..] [--ed ..]
+
+Bulk mode (needs NumPy and pandas; Parquet output also needs pyarrow):
+ python tgnpdcl_bill.py --input-csv meters.csv --output bills.csv
+ The input CSV has columns cu, type and optional pu, fc, cc, ed overrides
+ (blank = default; blank pu = slab tariff). calculate_bills() gives the same numbers as calculate_bill().
+
 Assumptions (reasonable defaults):
  Domestic: FC=50, CC=20, ED=5%
  Commercial : FC=100, CC=50, ED=12%
  Industrial : FC=200, CC=100, ED=18%
+ Slab rates (₹/unit) are listed per type in DEFAULTS['...']['slabs'] as
+ (upper unit limit, rate) pairs, the last slab having no upper limit.
 
 """
 import argparse
+import bisect
 import sys
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # only the bulk billing functions need these
+    np = pd = None
 
 DEFAULTS = {
-    'domestic': {'FC': 50.0, 'CC': 20.0, 'ED': 5.0},
-    'commercial':  {'FC': 100.0, 'CC': 50.0, 'ED': 12.0},
-    'industrial':  {'FC': 200.0, 'CC': 100.0, 'ED': 18.0},
+    'domestic': {'FC': 50.0, 'CC': 20.0, 'ED': 5.0,
+                 'slabs': [(50, 1.95), (100, 3.10), (200, 4.80), (300, 7.70),
+                           (400, 9.00), (800, 9.50), (None, 10.00)]},
+    'commercial':  {'FC': 100.0, 'CC': 50.0, 'ED': 12.0,
+                    'slabs': [(50, 7.00), (100, 8.50), (300, 9.90), (500, 10.40), (None, 11.00)]},
+    'industrial':  {'FC': 200.0, 'CC': 100.0, 'ED': 18.0,
+                    'slabs': [(None, 7.65)]},
 }
 
 
-def calculate_bill(pu: float, cu: float, cust_type: str, fc: float = None, cc: float = None, ed_percent: float = None) -> Dict[str, float]:
+def _build_slab_table(slabs: List[Tuple[Optional[float], float]]) -> Tuple[List[float], List[float], List[float]]:
+    """Precompute (lower bounds, rates, charge accumulated below each bound).
+
+    With these, the energy charge for cu units is
+    cumulative[i] + (cu - bounds[i]) * rates[i] where i is the slab holding cu,
+    found by bisect instead of walking the slabs.
+    """
+    bounds, rates, cumulative = [], [], []
+    lower, charged = 0.0, 0.0
+    for upper, rate in slabs:
+        bounds.append(lower)
+        rates.append(float(rate))
+        cumulative.append(charged)
+        if upper is None:
+            break
+        charged += (float(upper) - lower) * rate
+        lower = float(upper)
+    return bounds, rates, cumulative
+
+
+# Built once at load time: customer type -> (bounds, rates, cumulative)
+SLAB_TABLES = {t: _build_slab_table(d['slabs']) for t, d in DEFAULTS.items()}
+# The same tables as float arrays for np.searchsorted in bulk billing
+SLAB_ARRAYS = ({t: tuple(np.asarray(a, dtype=np.float64) for a in table) for t, table in SLAB_TABLES.items()}
+               if np is not None else {})
+
+
+def slab_energy_charge(cu: float, cust_type: str) -> float:
+    """Return the telescopic energy charge for cu units (O(log slabs))."""
+    bounds, rates, cumulative = SLAB_TABLES[cust_type]
+    i = max(bisect.bisect_right(bounds, cu) - 1, 0)
+    return cumulative[i] + (cu - bounds[i]) * rates[i]
+
+
+# Column order of the bill records, shared by the scalar and bulk paths.
+BILL_COLUMNS = ['PU', 'CU', 'CustomerType', 'EC', 'FC', 'CC', 'ED_percent', 'ED_amount', 'subtotal', 'total']
+
+# Rows read per chunk when billing from a CSV file.
+CHUNK_ROWS = 500_000
+
+
+def calculate_bill(pu: Optional[float], cu: float, cust_type: str, fc: float = None, cc: float = None, ed_percent: float = None) -> Dict[str, float]:
     """Calculate bill breakdown.
 
+    If pu is None the energy charge comes from the customer type's slab
+    tariff and PU is reported as the effective average price per unit.
+
     Returns a dict with EC, FC, CC, ED_percent, ED_amount, subtotal, total.
     """
     t = cust_type.lower()
@@ -51,7 +117,11 @@ def calculate_bill(pu: float, cu: float, cust_type: str, fc: float = None, cc: f
     CC = float(cc) if cc is not None else defaults['CC']
     ED = float(ed_percent) if ed_percent is not None else defaults['ED']
 
-    EC = float(pu) * float(cu)
+    if pu is None:
+        EC = slab_energy_charge(float(cu), t)
+        pu = EC / float(cu) if cu else 0.0
+    else:
+        EC = float(pu) * float(cu)
     subtotal = EC + FC + CC
     ED_amount = subtotal * (ED / 100.0)
     total = subtotal + ED_amount
@@ -70,6 +140,146 @@ def calculate_bill(pu: float, cu: float, cust_type: str, fc: float = None, cc: f
     }
 
 
+def _require_numpy():
+    if np is None:
+        raise RuntimeError('Bulk billing requires NumPy and pandas (pip install numpy pandas)')
+
+
+def _default_table(key: str):
+    """Return DEFAULTS[*][key] as an array indexed by customer-type code."""
+    return np.array([DEFAULTS[t][key] for t in DEFAULTS], dtype=np.float64)
+
+
+def _round2(values):
+    """Round to 2 decimals exactly like Python's round(x, 2).
+
+    np.round scales by 100 first, which can land on a .5 tie that round()
+    would not see; those rare elements are recomputed with round() itself.
+    """
+    out = np.round(values, 2)
+    scaled = values * 100.0
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        idx = np.flatnonzero(near_tie)
+        out[idx] = [round(float(v), 2) for v in values[idx]]
+    return out
+
+
+def _slab_energy_charges(cu, codes):
+    """Vectorized slab_energy_charge: one np.searchsorted per customer type."""
+    EC = np.empty_like(cu)
+    for code, t in enumerate(DEFAULTS):
+        rows = codes == code
+        if not rows.any():
+            continue
+        bounds, rates, cumulative = SLAB_ARRAYS[t]
+        units = cu[rows]
+        i = np.maximum(np.searchsorted(bounds, units, side='right') - 1, 0)
+        EC[rows] = cumulative[i] + (units - bounds[i]) * rates[i]
+    return EC
+
+
+def _override(column, default_by_code, codes):
+    """Use the override column where given (non-NaN), else the per-type default."""
+    defaults = default_by_code[codes]
+    if column is None:
+        return defaults
+    column = np.asarray(column, dtype=np.float64)
+    return np.where(np.isnan(column), defaults, column)
+
+
+def calculate_bills(data) -> 'pd.DataFrame':
+    """Vectorized calculate_bill over many customers.
+
+    Args:
+        data: DataFrame or dict of arrays with keys cu, type and optional
+            pu, fc, cc, ed (NaN means "use the default for that customer type";
+            a NaN or missing pu means "use the slab tariff").
+            Upper-case keys (PU, CU, ...) are accepted as well.
+
+    Returns:
+        DataFrame with BILL_COLUMNS, one row per customer, with the same
+        values calculate_bill() returns for each row.
+
+    Raises:
+        ValueError: If any row has an unknown customer type.
+    """
+    _require_numpy()
+    cols = {str(k).lower(): v for k, v in dict(data).items()}
+    cu = np.asarray(cols['cu'], dtype=np.float64)
+    pu = np.asarray(cols['pu'], dtype=np.float64) if 'pu' in cols else np.full_like(cu, np.nan)
+
+    types = pd.Series(np.asarray(cols['type'], dtype=object)).str.lower()
+    categories = list(DEFAULTS)
+    codes = pd.Categorical(types, categories=categories).codes
+    if (codes < 0).any():
+        bad = types[codes < 0].iloc[0]
+        raise ValueError(f"Unknown customer type: {bad}. Choose from {categories}")
+
+    FC = _override(cols.get('fc'), _default_table('FC'), codes)
+    CC = _override(cols.get('cc'), _default_table('CC'), codes)
+    ED = _override(cols.get('ed'), _default_table('ED'), codes)
+
+    # same operation order as calculate_bill so the floats match bit for bit
+    EC = pu * cu
+    slab = np.isnan(pu)
+    if slab.any():
+        EC[slab] = _slab_energy_charges(cu[slab], codes[slab])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pu = np.where(slab, np.where(cu != 0, EC / cu, 0.0), pu)
+    subtotal = EC + FC + CC
+    ED_amount = subtotal * (ED / 100.0)
+    total = subtotal + ED_amount
+
+    return pd.DataFrame({
+        'PU': pu,
+        'CU': cu,
+        'CustomerType': np.asarray(categories, dtype=object)[codes],
+        'EC': _round2(EC),
+        'FC': _round2(FC),
+        'CC': _round2(CC),
+        'ED_percent': _round2(ED),
+        'ED_amount': _round2(ED_amount),
+        'subtotal': _round2(subtotal),
+        'total': _round2(total),
+    }, columns=BILL_COLUMNS)
+
+
+def bill_csv(input_path: str, output_path: str, chunksize: int = CHUNK_ROWS) -> int:
+    """Stream customers from a CSV, bill them in chunks and write the results.
+
+    Output is Parquet if output_path ends in .parquet (requires pyarrow),
+    otherwise CSV. Returns the number of bills written.
+    """
+    _require_numpy()
+    parquet = output_path.lower().endswith('.parquet')
+    if parquet:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError('Parquet output requires pyarrow (pip install pyarrow); '
+                               'use a .csv output file instead') from None
+    writer = None
+    rows = 0
+    try:
+        with pd.read_csv(input_path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                bills = calculate_bills(chunk)
+                if parquet:
+                    table = pa.Table.from_pandas(bills, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, table.schema)
+                    writer.write_table(table)
+                else:
+                    bills.to_csv(output_path, mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+                rows += len(bills)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
 def print_bill(b: Dict[str, float]):
     print("\n===== TGNPDCL Energy Bill =====")
     print(f"Customer type : {b['CustomerType'].capitalize()}")
@@ -88,13 +298,21 @@ def print_bill(b: Dict[str, float]):
 
 def parse_args(argv=None):
     p = argparse.ArgumentParser(description='TGNPDCL Bill Generator')
-    p.add_argument('--pu', type=float, help='Price per unit (₹)')
-    p.add_argument('--cu', type=float, help='Consumed units')
+    p.add_argument('--pu', type=float, help='Price per unit (₹); omit to use the slab tariff')
+    p.add_argument('--cu', type=float, help='Consumed units (with --type: print one bill without prompting)')
     p.add_argument('--type', choices=list(DEFAULTS.keys()), help='Customer type')
     p.add_argument('--fc', type=float, help='Fixed Charges (override)')
     p.add_argument('--cc', type=float, help='Customer Charges (override)')
     p.add_argument('--ed', type=float, help='Electricity Duty % (override)')
-    return p.parse_args(argv)
+    p.add_argument('--input-csv', help='Bill every customer in this CSV (bulk mode)')
+    p.add_argument('--output', default='bills.csv', help='Bulk output file (.csv or .parquet)')
+    args = p.parse_args(argv)
+    single = [args.pu, args.cu, args.type, args.fc, args.cc, args.ed]
+    if any(v is not None for v in single) and (args.cu is None or args.type is None):
+        p.error('--cu and --type are both required for a single bill (--pu/--fc/--cc/--ed are optional)')
+    if args.input_csv and any(v is not None for v in single):
+        p.error('--input-csv takes its values from the file; do not combine it with --pu/--cu/--type/--fc/--cc/--ed')
+    return args
 
 
 def interactive_input():
@@ -104,8 +322,12 @@ def interactive_input():
     Returns: pu, cu, cust_type, fc_override, cc_override, ed_override
     """
     while True:
+        val = input('Enter Price per Unit (₹) [press Enter for slab tariff]: ').strip()
+        if val == '':
+            pu = None
+            break
         try:
-            pu = float(input('Enter Price per Unit (₹): ').strip())
+            pu = float(val)
             break
         except ValueError:
             print('Please enter a valid number for Price per Unit.')
@@ -144,7 +366,23 @@ def interactive_input():
 
 
 def main(argv=None):
-    # Always prompt the user for inputs after the program starts.
+    args = parse_args(argv)
+    if args.input_csv:
+        try:
+            rows = bill_csv(args.input_csv, args.output)
+        except (OSError, ValueError, RuntimeError, KeyError) as e:
+            print('Bulk billing failed:', e)
+            sys.exit(1)
+        print(f'Wrote {rows} bills to {args.output}')
+        return
+
+    if args.cu is not None:
+        # Single bill straight from the command line
+        bill = calculate_bill(pu=args.pu, cu=args.cu, cust_type=args.type, fc=args.fc, cc=args.cc, ed_percent=args.ed)
+        print_bill(bill)
+        return
+
+    # Otherwise prompt the user for inputs after the program starts.
     try:
         pu, cu, cust_type, fc_override, cc_override, ed_override = interactive_input()
     except Exception as e:
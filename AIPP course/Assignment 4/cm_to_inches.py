@@ -3,6 +3,9 @@
 Provides :func:`cm_to_inches` and a prompt loop for quick manual testing.
 
 Conversion: 1 inch = 2.54 cm
+
+For converting whole arrays or CSV columns between many units, see
+``conversions.py`` (``convert_many(values, "cm", "in")``).
 """
 
 def cm_to_inches(cm: float) -> float:
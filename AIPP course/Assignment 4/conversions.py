@@ -0,0 +1,168 @@
+"""Unit conversion registry with batch conversion over NumPy arrays.
+
+Every unit is registered with its scale relative to its dimension's base
+unit (metres, square metres, kelvin, joules) and its reading at the
+dimension's reference point: 0 for ratio scales, the freezing point of water
+for temperatures. A conversion between two units therefore collapses to
+``(value - shift) * factor + offset``, which is composed once per (from, to)
+pair and cached, so converting a whole column is one subtract and one
+multiply-add. Factors are taken from the exact decimal (or Fraction) ratio of
+the scales and offsets are applied around the reference point, so reference
+values such as 32 F -> 0 C convert exactly.
+
+Example:
+    >>> convert(2.54, "cm", "in")
+    1.0
+    >>> convert(100, "C", "F")
+    212.0
+    >>> convert(32, "F", "C")
+    0.0
+"""
+
+import argparse
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: convert_many falls back to a list
+    np = None
+
+
+class Unit(NamedTuple):
+    dimension: str
+    scale: float  # base units per unit (float or Fraction)
+    offset: float = 0.0  # reading at the dimension's reference point
+
+
+UNITS: Dict[str, Unit] = {
+    # length (base: metre)
+    "m": Unit("length", 1.0),
+    "km": Unit("length", 1000.0),
+    "cm": Unit("length", 0.01),
+    "mm": Unit("length", 0.001),
+    "in": Unit("length", 0.0254),
+    "ft": Unit("length", 0.3048),
+    "yd": Unit("length", 0.9144),
+    "mi": Unit("length", 1609.344),
+    # area (base: square metre)
+    "m2": Unit("area", 1.0),
+    "cm2": Unit("area", 1e-4),
+    "km2": Unit("area", 1e6),
+    "in2": Unit("area", 0.0254 ** 2),
+    "ft2": Unit("area", 0.3048 ** 2),
+    "acre": Unit("area", 4046.8564224),
+    "ha": Unit("area", 1e4),
+    # temperature (base: kelvin; reference point: water freezes)
+    "K": Unit("temperature", 1.0, 273.15),
+    "C": Unit("temperature", 1.0, 0.0),
+    "F": Unit("temperature", Fraction(5, 9), 32.0),
+    # energy (base: joule)
+    "J": Unit("energy", 1.0),
+    "kJ": Unit("energy", 1e3),
+    "cal": Unit("energy", 4.184),
+    "kcal": Unit("energy", 4184.0),
+    "Wh": Unit("energy", 3600.0),
+    "kWh": Unit("energy", 3.6e6),
+    "BTU": Unit("energy", 1055.05585262),
+}
+
+
+def register_unit(name: str, dimension: str, scale: float, offset: float = 0.0) -> None:
+    """Add or replace a unit and drop cached conversion factors.
+
+    ``scale`` may be a Fraction for ratios with no exact decimal form (5/9).
+    ``offset`` is the unit's reading at the dimension's reference point.
+    """
+    UNITS[name] = Unit(dimension, scale if isinstance(scale, Fraction) else float(scale), float(offset))
+    conversion_factors.cache_clear()
+
+
+def _exact(number) -> Fraction:
+    # The decimal as written (0.3048, not its binary approximation), so that
+    # ratios such as ft/in come out as exactly 12
+    return Fraction(str(number))
+
+
+@lru_cache(maxsize=None)
+def conversion_factors(from_unit: str, to_unit: str) -> Tuple[float, float, float]:
+    """Return (shift, factor, offset) such that ``to = (from - shift) * factor + offset``.
+
+    Raises:
+        KeyError: if either unit is not registered.
+        ValueError: if the units measure different dimensions.
+    """
+    try:
+        src, dst = UNITS[from_unit], UNITS[to_unit]
+    except KeyError as exc:
+        raise KeyError(f"unknown unit {exc.args[0]!r}; known units: {sorted(UNITS)}") from None
+    if src.dimension != dst.dimension:
+        raise ValueError(f"cannot convert {src.dimension} ({from_unit}) to {dst.dimension} ({to_unit})")
+    return src.offset, float(_exact(src.scale) / _exact(dst.scale)), dst.offset
+
+
+def convert(value: float, from_unit: str, to_unit: str) -> float:
+    """Convert a single value between two registered units."""
+    shift, factor, offset = conversion_factors(from_unit, to_unit)
+    return (value - shift) * factor + offset
+
+
+def convert_many(values, from_unit: str, to_unit: str):
+    """Convert a sequence or array of values in one vectorized step.
+
+    Returns a float64 NumPy array when NumPy is installed, otherwise a list.
+    """
+    shift, factor, offset = conversion_factors(from_unit, to_unit)
+    if np is not None:
+        out = np.asarray(values, dtype=np.float64)
+        out = (out - shift) * factor if shift else out * factor
+        if offset:
+            out += offset
+        return out
+    return [(v - shift) * factor + offset for v in values]
+
+
+def convert_csv_column(input_path: str, output_path: str, column: str, from_unit: str,
+                       to_unit: str, chunksize: int = 500_000) -> int:
+    """Stream a CSV, convert one column in place and write the result.
+
+    Requires pandas. Returns the number of rows written.
+    """
+    import pandas as pd
+
+    conversion_factors(from_unit, to_unit)  # fail fast on bad units
+    rows = 0
+    with pd.read_csv(input_path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            chunk[column] = convert_many(chunk[column].to_numpy(), from_unit, to_unit)
+            chunk.to_csv(output_path, mode="w" if rows == 0 else "a", header=rows == 0, index=False)
+            rows += len(chunk)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert values or a CSV column between units.")
+    parser.add_argument("from_unit", help=f"source unit ({', '.join(UNITS)})")
+    parser.add_argument("to_unit", help="target unit")
+    parser.add_argument("values", nargs="*", type=float, help="values to convert")
+    parser.add_argument("--csv", help="input CSV file (with --column and --output)")
+    parser.add_argument("--column", help="CSV column to convert")
+    parser.add_argument("--output", default="converted.csv", help="output CSV file")
+    args = parser.parse_args()
+
+    try:
+        if args.csv:
+            if not args.column:
+                parser.error("--csv needs --column")
+            rows = convert_csv_column(args.csv, args.output, args.column, args.from_unit, args.to_unit)
+            print(f"Converted {rows} rows into {args.output}")
+        else:
+            for v, out in zip(args.values, convert_many(args.values, args.from_unit, args.to_unit)):
+                print(f"{v} {args.from_unit} = {float(out):.6g} {args.to_unit}")
+    except (KeyError, ValueError, OSError) as exc:
+        print(f"Error: {exc}")
+
+
+if __name__ == "__main__":
+    main()
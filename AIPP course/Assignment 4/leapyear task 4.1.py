@@ -15,10 +15,29 @@ Example:
   >>> is_leap_year(1900)
   False
 
+Bulk helpers for date-bucketing jobs:
+- :func:`is_leap_year_array` returns a NumPy boolean mask for many years,
+- :func:`count_leap_years` counts leap years in a range in O(1),
+- :func:`day_number` / :func:`days_between` (and :func:`day_number_array`)
+  turn dates into day counts using the same closed-form leap count.
+
+  >>> count_leap_years(1900, 2000)
+  25
+  >>> days_between((2024, 1, 1), (2025, 1, 1))
+  366
+
 The script also supports running as a script and will prompt for input.
 """
 
-from typing import Any
+from typing import Any, Tuple, Union
+
+try:
+  import numpy as np
+except ImportError:  # only the *_array helpers need NumPy
+  np = None
+
+# Days before the first of each month in a non-leap year.
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
 
 
 def is_leap_year(year: int) -> bool:
@@ -38,6 +57,92 @@ def is_leap_year(year: int) -> bool:
   return (year % 4 == 0) and (year % 100 != 0 or year % 400 == 0)
 
 
+def is_leap_year_array(years) -> "np.ndarray":
+  """Return a boolean mask marking the leap years in an integer array.
+
+  Same Gregorian rules as :func:`is_leap_year`, evaluated as array
+  operations. Raises RuntimeError if NumPy is not installed.
+  """
+
+  if np is None:
+    raise RuntimeError("is_leap_year_array requires NumPy")
+  y = np.asarray(years, dtype=np.int64)
+  return (y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0))
+
+
+def _leap_years_through(year):
+  """Leap years in 1..year (closed form; floor division keeps it valid for year <= 0)."""
+
+  return year // 4 - year // 100 + year // 400
+
+
+def count_leap_years(a: int, b: int) -> int:
+  """Return the number of leap years y with a <= y <= b, in O(1).
+
+  Uses inclusion-exclusion over multiples of 4, 100 and 400. Returns 0 when
+  a > b.
+  """
+
+  if not isinstance(a, int) or not isinstance(b, int):
+    raise TypeError("years must be integers")
+  if a > b:
+    return 0
+  return _leap_years_through(b) - _leap_years_through(a - 1)
+
+
+DateLike = Union[Tuple[int, int, int], Any]
+
+
+def day_number(year: int, month: int, day: int) -> int:
+  """Return the proleptic Gregorian day number (0001-01-01 is day 1).
+
+  Matches ``datetime.date(year, month, day).toordinal()`` but also accepts
+  years outside 1..9999. Raises ValueError for a month outside 1..12.
+  """
+
+  if not 1 <= month <= 12:
+    raise ValueError("month must be in 1..12")
+  prev = year - 1
+  days = 365 * prev + _leap_years_through(prev) + _DAYS_BEFORE_MONTH[month - 1] + day
+  if month > 2 and is_leap_year(year):
+    days += 1
+  return days
+
+
+def _as_ymd(d: DateLike) -> Tuple[int, int, int]:
+  if isinstance(d, tuple):
+    return d
+  return d.year, d.month, d.day
+
+
+def days_between(start: DateLike, end: DateLike) -> int:
+  """Return the number of days from start to end (negative if end is earlier).
+
+  Dates may be ``(year, month, day)`` tuples or ``datetime.date`` objects.
+  """
+
+  return day_number(*_as_ymd(end)) - day_number(*_as_ymd(start))
+
+
+def day_number_array(years, months, days) -> "np.ndarray":
+  """Vectorized :func:`day_number` over equal-length integer arrays.
+
+  Days between two date columns is then just a subtraction of two results.
+  Raises ValueError for a month outside 1..12.
+  """
+
+  if np is None:
+    raise RuntimeError("day_number_array requires NumPy")
+  y = np.asarray(years, dtype=np.int64)
+  m = np.asarray(months, dtype=np.int64)
+  d = np.asarray(days, dtype=np.int64)
+  if m.size and (m.min() < 1 or m.max() > 12):
+    raise ValueError("month must be in 1..12")
+  prev = y - 1
+  out = 365 * prev + _leap_years_through(prev) + np.asarray(_DAYS_BEFORE_MONTH, dtype=np.int64)[m - 1] + d
+  return out + ((m > 2) & is_leap_year_array(y))
+
+
 def _prompt_loop() -> None:
   """Simple input loop for checking years from the user."""
 
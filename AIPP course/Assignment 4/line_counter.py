@@ -7,21 +7,53 @@ Provides a function to count lines in a text file, an interactive prompt, and a
 Usage:
   python line_counter.py               # interactive prompt
   python line_counter.py --path file.txt
+  python line_counter.py --binary --jobs 8 logs/ other.log   # many files/trees in parallel
+  python line_counter.py --benchmark big.log                 # text vs binary vs mmap
+  python line_counter.py --index counts.json logs/           # incremental rescans of growing logs
+  python line_counter.py --path big.log --line 1000000       # print one line via a .lineidx sidecar
   python line_counter.py --test        # run self-tests
 """
 
 from __future__ import annotations
 import argparse
+import array
+import json
+import mmap
 import os
 import tempfile
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional: speeds up build_line_index
+    np = None
 
-def count_lines(path: str) -> int:
+# Read size for binary counting; large buffers keep bytes.count in C for longer.
+BUFFER_SIZE = 1 << 20
+
+
+def _check_file(path: str) -> str:
+    """Validate that path names an existing regular file and return it as str."""
+    if path is None:
+        raise ValueError('path cannot be None')
+    path = str(path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'No such file: {path}')
+    if os.path.isdir(path):
+        raise IsADirectoryError(f'Path is a directory: {path}')
+    return path
+
+
+def count_lines(path: str, index: Optional['LineCountIndex'] = None) -> int:
     """Return the number of lines in the file at `path`.
 
     Args:
         path: Path to the file to read. Should point to a text file (commonly .txt), but any file path is accepted.
+        index: Optional LineCountIndex. When given, the count is done in binary
+            mode and resumes from the last indexed offset if the file only grew.
 
     Returns:
         The number of lines in the file as an int.
@@ -35,13 +67,9 @@ def count_lines(path: str) -> int:
     - Opens the file with UTF-8 encoding and `errors='replace'` to avoid UnicodeDecodeError on mixed encodings.
     - Uses an iterator to count lines efficiently without loading the whole file.
     """
-    if path is None:
-        raise ValueError('path cannot be None')
-    path = str(path)
-    if not os.path.exists(path):
-        raise FileNotFoundError(f'No such file: {path}')
-    if os.path.isdir(path):
-        raise IsADirectoryError(f'Path is a directory: {path}')
+    if index is not None:
+        return index.count(path)
+    path = _check_file(path)
 
     count = 0
     # Use a buffered iterator to count lines efficiently.
@@ -51,6 +79,305 @@ def count_lines(path: str) -> int:
     return count
 
 
+def count_lines_binary(path: str, buffer_size: int = BUFFER_SIZE, use_mmap: bool = False) -> int:
+    """Return the number of lines in the file at `path` without decoding it.
+
+    Counts b'\\n' with bytes.count over large raw reads (or over an mmap of the
+    whole file when use_mmap is True), plus one for a final line that has no
+    trailing newline. This matches count_lines for '\\n' and '\\r\\n' files;
+    unlike text mode, a lone '\\r' is not treated as a line break.
+
+    Raises the same errors as count_lines.
+    """
+    path = _check_file(path)
+
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        if use_mmap:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                count = _count_mmap(mm, buffer_size)
+                last = mm[size - 1:size]
+        else:
+            count, last = _count_newlines(f, buffer_size)
+    return count + (last != b'\n')
+
+
+def _count_newlines(f, buffer_size: int = BUFFER_SIZE, limit: Optional[int] = None) -> Tuple[int, bytes]:
+    """Count b'\\n' from the current position of binary file f to EOF.
+
+    With limit, at most that many bytes are read, so a file that is still
+    being appended to is counted only up to a size taken earlier.
+    Returns (newline_count, last_byte_read); last_byte_read is b'' if nothing was read.
+    """
+    count = 0
+    last = b''
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    while limit is None or limit > 0:
+        n = f.readinto(view if limit is None or limit >= buffer_size else view[:limit])
+        if not n:
+            break
+        if limit is not None:
+            limit -= n
+        count += buf.count(b'\n', 0, n)
+        last = bytes(buf[n - 1:n])
+    return count, last
+
+
+def _count_mmap(mm: mmap.mmap, step: int) -> int:
+    """Count b'\\n' in an mmap one slice at a time so only one slice is copied."""
+    count = 0
+    for start in range(0, len(mm), step):
+        count += mm[start:start + step].count(b'\n')
+    return count
+
+
+class LineCountIndex:
+    """Persistent (path -> inode, mtime, size, offset, newlines) index.
+
+    count() resumes from the stored byte offset when a file has only grown
+    (same device/inode, size not smaller), so periodic scans of append-only
+    logs read only the new bytes. A truncated or replaced file, or one
+    rewritten in place with the same size, is rescanned from the start.
+    The index is a JSON file written by save().
+    """
+
+    def __init__(self, index_path: Optional[str] = None) -> None:
+        self.index_path = index_path
+        self.entries: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        if index_path and os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def save(self) -> None:
+        """Write the index atomically (temp file + rename)."""
+        if not self.index_path:
+            return
+        tmp = self.index_path + '.tmp'
+        with self._lock:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+        os.replace(tmp, self.index_path)
+
+    def count(self, path: str, buffer_size: int = BUFFER_SIZE) -> int:
+        """Return the line count of path, reading only bytes not yet indexed."""
+        path = _check_file(path)
+        key = os.path.abspath(path)
+        with open(path, 'rb', buffering=0) as f:
+            st = os.fstat(f.fileno())
+            with self._lock:
+                entry = self.entries.get(key)
+            same_file = (entry is not None and entry['dev'] == st.st_dev
+                         and entry['inode'] == st.st_ino)
+            # Reads stop at the st_size recorded above: bytes appended meanwhile
+            # are left for the next scan, which resumes from the stored offset
+            if same_file and st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']:
+                newlines, offset = entry['newlines'], entry['offset']
+                last = b''
+                if st.st_size:
+                    f.seek(st.st_size - 1)
+                    last = f.read(1)
+            elif same_file and st.st_size > entry['size']:
+                # append-only growth: count just the new tail
+                f.seek(entry['offset'])
+                added, last = _count_newlines(f, buffer_size, st.st_size - entry['offset'])
+                newlines = entry['newlines'] + added
+                offset = f.tell()
+            else:
+                newlines, last = _count_newlines(f, buffer_size, st.st_size)
+                offset = f.tell()
+        with self._lock:
+            self.entries[key] = {
+                'dev': st.st_dev, 'inode': st.st_ino, 'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size, 'offset': offset, 'newlines': newlines,
+            }
+        return newlines + (bool(last) and last != b'\n')
+
+
+LINE_INDEX_SUFFIX = '.lineidx'
+_OFFSET = array.array('Q')
+# Sidecar header: (st_dev, st_ino, st_size, st_mtime_ns) of the indexed file
+_HEADER_ENTRIES = 4
+
+
+def _line_index_path(path: str) -> str:
+    return str(path) + LINE_INDEX_SUFFIX
+
+
+def _newline_positions(chunk: bytes, start: int) -> Iterable[int]:
+    """Yield absolute offsets just past each b'\\n' in chunk (which begins at start)."""
+    if np is not None:
+        return (np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10) + (start + 1)).tolist()
+    out = []
+    pos = chunk.find(b'\n')
+    while pos != -1:
+        out.append(start + pos + 1)
+        pos = chunk.find(b'\n', pos + 1)
+    return out
+
+
+def _source_header(st: os.stat_result) -> array.array:
+    return array.array('Q', [st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns])
+
+
+def build_line_index(path: str, index_path: Optional[str] = None, buffer_size: int = BUFFER_SIZE) -> int:
+    """Write a sidecar file with the byte offset where each line starts.
+
+    One pass over an mmap of the file collects the offsets into an
+    array('Q') (native-endian unsigned 64-bit), which is written to
+    index_path (default: path + '.lineidx') after a header holding the
+    file's device, inode, size and mtime. Returns the number of lines.
+    """
+    path = _check_file(path)
+    index_path = index_path or _line_index_path(path)
+    offsets = array.array('Q')
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        if size:
+            offsets.append(0)
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                for start in range(0, size, buffer_size):
+                    offsets.extend(_newline_positions(mm[start:start + buffer_size], start))
+            if offsets[-1] == size:
+                # a trailing newline does not start another line
+                offsets.pop()
+    with open(index_path, 'wb') as out:
+        _source_header(st).tofile(out)
+        offsets.tofile(out)
+    return len(offsets)
+
+
+def _ensure_line_index(path: str) -> str:
+    """Return the sidecar path, (re)building it if missing or not built from this file.
+
+    The sidecar is reused only if its header matches the file's current
+    device, inode, size and mtime, so a log replaced by an older file
+    (mv, cp -p, rsync -t) is reindexed rather than read with stale offsets.
+    """
+    path = _check_file(path)
+    index_path = _line_index_path(path)
+    if _read_offsets(index_path, -_HEADER_ENTRIES, _HEADER_ENTRIES) != _source_header(os.stat(path)):
+        build_line_index(path, index_path)
+    return index_path
+
+
+def _read_offsets(index_path: str, first: int, count: int) -> array.array:
+    """Read count line offsets starting at line first from the sidecar file.
+
+    first=-_HEADER_ENTRIES reads the header; a missing sidecar reads as empty.
+    """
+    out = array.array('Q')
+    if not os.path.exists(index_path):
+        return out
+    with open(index_path, 'rb') as f:
+        f.seek((first + _HEADER_ENTRIES) * _OFFSET.itemsize)
+        data = f.read(count * _OFFSET.itemsize)
+    out.frombytes(data[:len(data) - len(data) % _OFFSET.itemsize])
+    return out
+
+
+def get_lines(path: str, lines: range) -> List[str]:
+    """Return the lines (0-based, ending stripped) selected by a step-1 range.
+
+    Uses the .lineidx sidecar (built on first use) to seek straight to the
+    first line, then reads the whole span in one call.
+
+    Raises:
+        IndexError: If the range falls outside the file.
+        ValueError: If the range step is not 1.
+    """
+    if lines.step != 1:
+        raise ValueError('only ranges with step 1 are supported')
+    if len(lines) == 0:
+        return []
+    index_path = _ensure_line_index(path)
+    total = os.path.getsize(index_path) // _OFFSET.itemsize - _HEADER_ENTRIES
+    if lines.start < 0 or lines.stop > total:
+        raise IndexError(f'line range {lines.start}..{lines.stop - 1} out of range (file has {total} lines)')
+    # one extra offset marks where the last requested line ends
+    offsets = _read_offsets(index_path, lines.start, len(lines) + 1)
+    with open(path, 'rb') as f:
+        f.seek(offsets[0])
+        if len(offsets) > len(lines):
+            data = f.read(offsets[-1] - offsets[0])
+        else:
+            data = f.read()
+    out = data.decode('utf-8', errors='replace').split('\n')
+    if len(out) > len(lines):
+        out.pop()
+    return [line.rstrip('\r') for line in out]
+
+
+def get_line(path: str, n: int) -> str:
+    """Return line n (0-based) of the file without scanning from the start."""
+    return get_lines(path, range(n, n + 1))[0]
+
+
+def iter_files(paths: Iterable[str]) -> Iterable[str]:
+    """Yield each file path, expanding directories recursively (sorted order)."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def count_many(paths: Iterable[str], jobs: int = 1, binary: bool = True,
+               index: Optional[LineCountIndex] = None) -> List[Tuple[str, object]]:
+    """Count lines in many files and directory trees using a thread pool.
+
+    Returns (path, count) pairs in input order; count is the exception
+    instance instead of an int for files that could not be read. With an
+    index, files are counted incrementally (binary mode).
+    """
+    if index is not None:
+        counter = index.count
+    else:
+        counter = count_lines_binary if binary else count_lines
+
+    def safe_count(path: str):
+        try:
+            return path, counter(path)
+        except (OSError, ValueError) as exc:
+            return path, exc
+
+    files = list(iter_files(paths))
+    if jobs <= 1:
+        return [safe_count(p) for p in files]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(safe_count, files))
+
+
+def benchmark(paths: Iterable[str], repeat: int = 3) -> List[Tuple[str, int, float]]:
+    """Time text, binary and mmap counting over paths.
+
+    Returns (method, total_lines, best_seconds) per method.
+    """
+    files = [p for p in iter_files(paths) if os.path.isfile(p)]
+    methods = [
+        ('text iterator', count_lines),
+        ('binary buffered', count_lines_binary),
+        ('binary mmap', lambda p: count_lines_binary(p, use_mmap=True)),
+    ]
+    results = []
+    for name, counter in methods:
+        best = float('inf')
+        total = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            total = sum(counter(p) for p in files)
+            best = min(best, time.perf_counter() - start)
+        results.append((name, total, best))
+    return results
+
+
 def prompt_and_count() -> None:
     """Interactive loop: prompt the user for a file path and print counts.
 
@@ -136,12 +463,147 @@ def run_tests() -> None:
         except OSError:
             pass
 
+    # Test 6: binary and mmap modes agree with text mode, including across buffer edges
+    samples = [b'', b'x', b'a\nb\n', b'a\nb', b'a\r\nb\r\n', b'\n' * 10, b'row\n' * 5000 + b'tail']
+    for data in samples:
+        with tempfile.NamedTemporaryFile('wb', delete=False, suffix='.txt') as t6:
+            t6.write(data)
+            t6_path = t6.name
+        try:
+            expected = count_lines(t6_path)
+            assert count_lines_binary(t6_path) == expected
+            assert count_lines_binary(t6_path, buffer_size=7) == expected
+            assert count_lines_binary(t6_path, buffer_size=7, use_mmap=True) == expected
+            assert count_lines_binary(t6_path, use_mmap=True) == expected
+        finally:
+            os.remove(t6_path)
+
+    # Test 7: the index resumes on growth and rescans on truncation/replacement
+    tmpdir = tempfile.mkdtemp()
+    log_path = os.path.join(tmpdir, 'app.log')
+    idx_path = os.path.join(tmpdir, 'index.json')
+    try:
+        with open(log_path, 'wb') as f:
+            f.write(b'a\nb\nc')
+        idx = LineCountIndex(idx_path)
+        assert count_lines(log_path, index=idx) == 3
+        idx.save()
+        with open(log_path, 'ab') as f:
+            f.write(b'c\nd\n')
+        idx = LineCountIndex(idx_path)
+        assert count_lines(log_path, index=idx) == 4
+        assert idx.entries[os.path.abspath(log_path)]['offset'] == os.path.getsize(log_path)
+        with open(log_path, 'wb') as f:
+            f.write(b'x\n')
+        assert count_lines(log_path, index=idx) == 1
+        os.remove(log_path)
+        with open(log_path, 'wb') as f:
+            f.write(b'1\n2\n3\n4\n5\n6\n')
+        assert count_lines(log_path, index=idx) == 6
+    finally:
+        for name in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, name))
+        os.rmdir(tmpdir)
+
+    # Test 7b: lines appended between fstat and the read are counted once, on the next scan
+    global _count_newlines
+    tmpdir = tempfile.mkdtemp()
+    log_path = os.path.join(tmpdir, 'app.log')
+    real_count_newlines = _count_newlines
+
+    def count_while_appending(f, *args, **kwargs):
+        with open(log_path, 'ab') as w:
+            w.write(b'late\n' * 5)
+        return real_count_newlines(f, *args, **kwargs)
+
+    try:
+        with open(log_path, 'wb') as f:
+            f.write(b'line\n' * 10)
+        idx = LineCountIndex()
+        _count_newlines = count_while_appending
+        try:
+            assert count_lines(log_path, index=idx) == 10
+        finally:
+            _count_newlines = real_count_newlines
+        with open(log_path, 'ab') as f:
+            f.write(b'last')
+        assert count_lines(log_path, index=idx) == count_lines(log_path) == 16
+        assert count_lines(log_path, index=idx) == 16
+    finally:
+        for name in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, name))
+        os.rmdir(tmpdir)
+
+    # Test 8: line index sidecar and random access
+    samples = [b'', b'one', b'one\ntwo\n', b'one\r\ntwo\nthree', b'\n\nx\n']
+    for data in samples:
+        with tempfile.NamedTemporaryFile('wb', delete=False, suffix='.txt') as t8:
+            t8.write(data)
+            t8_path = t8.name
+        try:
+            expected = data.decode().splitlines()
+            assert build_line_index(t8_path, buffer_size=3) == count_lines(t8_path) == len(expected)
+            assert get_lines(t8_path, range(len(expected))) == expected
+            for i, line in enumerate(expected):
+                assert get_line(t8_path, i) == line
+            raised = False
+            try:
+                get_line(t8_path, len(expected))
+            except IndexError:
+                raised = True
+            assert raised
+        finally:
+            os.remove(t8_path)
+            if os.path.exists(t8_path + LINE_INDEX_SUFFIX):
+                os.remove(t8_path + LINE_INDEX_SUFFIX)
+
+    # Test 8b: a file replaced by an older one (mv of a restored log) is reindexed
+    tmpdir = tempfile.mkdtemp()
+    log_path = os.path.join(tmpdir, 'app.log')
+    old_path = os.path.join(tmpdir, 'restored.log')
+    try:
+        with open(log_path, 'wb') as f:
+            f.write(b'first\nxxxxxxx\n')
+        assert get_line(log_path, 1) == 'xxxxxxx'
+        with open(old_path, 'wb') as f:
+            f.write(b'a longer first\nsecond\n')
+        past = os.path.getmtime(log_path) - 3600
+        os.utime(old_path, (past, past))
+        os.replace(old_path, log_path)
+        assert get_line(log_path, 1) == 'second'
+        assert get_lines(log_path, range(2)) == ['a longer first', 'second']
+    finally:
+        for name in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, name))
+        os.rmdir(tmpdir)
+
+    # Test 9: count_many walks directories and reports unreadable paths
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for i in range(3):
+            with open(os.path.join(tmpdir, f'f{i}.txt'), 'w') as f:
+                f.write('x\n' * (i + 1))
+        missing = os.path.join(tmpdir, 'missing.txt')
+        results = count_many([tmpdir, missing], jobs=2)
+        assert [c for _, c in results[:3]] == [1, 2, 3]
+        assert isinstance(results[3][1], FileNotFoundError)
+    finally:
+        for name in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, name))
+        os.rmdir(tmpdir)
+
     print('All tests passed.')
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description='Count lines in a text file.')
     parser.add_argument('--path', type=str, help='Path to the file to count lines')
+    parser.add_argument('paths', nargs='*', help='Files or directories to count (directories are walked)')
+    parser.add_argument('--binary', action='store_true', help='Count raw b"\\n" bytes instead of decoding text')
+    parser.add_argument('--jobs', type=int, default=1, help='Number of files to count in parallel')
+    parser.add_argument('--benchmark', action='store_true', help='Compare text, binary and mmap counting')
+    parser.add_argument('--index', type=str, help='JSON index file for incremental counting of growing files')
+    parser.add_argument('--line', type=int, help='Print this line (0-based) of --path using a line-offset sidecar')
     parser.add_argument('--test', action='store_true', help='Run self-tests')
     parser.add_argument('--interactive', action='store_true', help='Prompt for a file path interactively')
     args = parser.parse_args()
@@ -150,9 +612,44 @@ def main() -> None:
         run_tests()
         return
 
+    targets = ([args.path] if args.path else []) + args.paths
+
+    if args.benchmark:
+        if not targets:
+            parser.error('--benchmark needs at least one file or directory')
+        for name, total, secs in benchmark(targets):
+            print(f'{name:<16} {total:>12} lines  {secs:.4f}s')
+        return
+
+    if args.line is not None:
+        if not args.path:
+            parser.error('--line needs --path')
+        try:
+            print(get_line(args.path, args.line))
+        except (OSError, IndexError) as exc:
+            print(f'Error: {exc}')
+        return
+
+    index = LineCountIndex(args.index) if args.index else None
+
+    if args.paths or args.jobs > 1 or index is not None or (args.path and os.path.isdir(args.path)):
+        grand_total = 0
+        results = count_many(targets, jobs=args.jobs, binary=args.binary, index=index)
+        if index is not None:
+            index.save()
+        for path, result in results:
+            if isinstance(result, Exception):
+                print(f'{path}: Error: {result}')
+                continue
+            grand_total += result
+            print(f'{path}: {result}')
+        print(f'Total lines: {grand_total}')
+        return
+
     if args.path:
+        counter = count_lines_binary if args.binary else count_lines
         try:
-            total = count_lines(args.path)
+            total = counter(args.path)
             print(f'Total lines: {total}')
         except Exception as exc:
             print(f'Error: {exc}')
@@ -5,10 +5,39 @@ vowel_counter.py
 Counts vowels in a string. Usage:
   python vowel_counter.py            # interactive prompt
   python vowel_counter.py --include-y
+  python vowel_counter.py --file corpus.txt --classes vowels,consonants,digits
+  python vowel_counter.py --file corpus.txt --chars xyz   # custom character set
   python vowel_counter.py --test     # run self-tests
+
+File mode streams the input in binary chunks and counts ASCII character
+classes with a byte histogram (NumPy) or bytes.translate, so large corpora
+are counted without a per-character Python loop.
 """
 
 import argparse
+import os
+import string
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:  # optional: file mode falls back to bytes.translate
+    np = None
+
+# Named ASCII character classes (matching is case-insensitive).
+CHARACTER_CLASSES = {
+    'vowels': 'aeiou',
+    'vowels_y': 'aeiouy',
+    'consonants': ''.join(c for c in string.ascii_lowercase if c not in 'aeiou'),
+    'consonants_no_y': ''.join(c for c in string.ascii_lowercase if c not in 'aeiouy'),
+    'digits': string.digits,
+}
+
+CHUNK_SIZE = 1 << 20
+
+# str.translate tables that delete vowels; the length difference is the count.
+_DELETE_VOWELS = str.maketrans('', '', 'aeiouAEIOU')
+_DELETE_VOWELS_Y = str.maketrans('', '', 'aeiouyAEIOUY')
 
 
 def count_vowels(text, include_y: bool = False) -> int:
@@ -31,11 +60,8 @@ def count_vowels(text, include_y: bool = False) -> int:
     """
     if text is None:
         return 0
-    vowels = set('aeiou')
-    if include_y:
-        vowels.add('y')
-    s = str(text).lower()
-    return sum(1 for ch in s if ch in vowels)
+    s = str(text)
+    return len(s) - len(s.translate(_DELETE_VOWELS_Y if include_y else _DELETE_VOWELS))
 
 
 def breakdown(text, include_y: bool = False) -> dict:
@@ -43,14 +69,63 @@ def breakdown(text, include_y: bool = False) -> dict:
 
     Returns a dict mapping each vowel character to its count.
     """
-    vowels = list('aeiou')
-    if include_y:
-        vowels.append('y')
-    counts = {v: 0 for v in vowels}
-    for ch in str(text).lower():
-        if ch in counts:
-            counts[ch] += 1
-    return counts
+    vowels = CHARACTER_CLASSES['vowels_y' if include_y else 'vowels']
+    s = str(text)
+    return {v: s.count(v) + s.count(v.upper()) for v in vowels}
+
+
+def _class_bytes(chars: str) -> bytes:
+    """Return the ASCII bytes of chars in both cases; reject non-ASCII input."""
+    if not chars.isascii():
+        raise ValueError(f'character classes must be ASCII: {chars!r}')
+    return bytes(sorted(set((chars.lower() + chars.upper()).encode('ascii'))))
+
+
+def compile_classes(classes) -> dict:
+    """Map class names (from CHARACTER_CLASSES) or {name: chars} to byte sets."""
+    if isinstance(classes, dict):
+        items = classes.items()
+    else:
+        unknown = [c for c in classes if c not in CHARACTER_CLASSES]
+        if unknown:
+            raise ValueError(f'Unknown character classes: {unknown}. Choose from {list(CHARACTER_CLASSES)}')
+        items = ((c, CHARACTER_CLASSES[c]) for c in classes)
+    return {name: _class_bytes(chars) for name, chars in items}
+
+
+def count_classes_bytes(data: bytes, compiled: dict) -> dict:
+    """Count bytes of each compiled class in one buffer.
+
+    With NumPy a single 256-bin histogram answers every class; otherwise
+    each class is one bytes.translate deletion pass.
+    """
+    if np is not None:
+        hist = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        return {name: int(hist[list(members)].sum()) for name, members in compiled.items()}
+    return {name: len(data) - len(data.translate(None, members)) for name, members in compiled.items()}
+
+
+def count_file(path: str, classes=('vowels',), chunk_size: int = CHUNK_SIZE) -> dict:
+    """Stream the file at path in binary chunks and count each character class.
+
+    Args:
+        path: File to read.
+        classes: Names from CHARACTER_CLASSES, or a dict of {name: chars}.
+        chunk_size: Bytes read per chunk; memory use is bounded by this.
+
+    Returns:
+        Dict mapping class name to count.
+    """
+    compiled = compile_classes(classes)
+    totals = {name: 0 for name in compiled}
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            for name, n in count_classes_bytes(chunk, compiled).items():
+                totals[name] += n
+    return totals
 
 
 def run_tests() -> None:
@@ -70,12 +145,35 @@ def run_tests() -> None:
     assert bd['o'] == 2
     assert bd['u'] == 2
     assert bd['y'] == 2
+    # table-driven byte counting, with and without NumPy
+    global np
+    data = b'Hello, World! 123 rhythm \xc3\xa9'
+    compiled = compile_classes(['vowels', 'vowels_y', 'consonants', 'digits'])
+    saved, expected = np, {'vowels': 3, 'vowels_y': 4, 'consonants': 13, 'digits': 3}
+    try:
+        assert count_classes_bytes(data, compiled) == expected
+        np = None
+        assert count_classes_bytes(data, compiled) == expected
+    finally:
+        np = saved
+    assert count_classes_bytes(b'xXz', compile_classes({'custom': 'x'})) == {'custom': 2}
+    with tempfile.NamedTemporaryFile('wb', delete=False) as t:
+        t.write(data * 100)
+        t_path = t.name
+    try:
+        assert count_file(t_path, ['vowels'], chunk_size=7) == {'vowels': 300}
+    finally:
+        os.remove(t_path)
     print('All tests passed.')
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description='Count vowels in a string.')
     parser.add_argument('--include-y', action='store_true', help="Consider 'y' a vowel")
+    parser.add_argument('--file', type=str, help='Stream this file and count character classes')
+    parser.add_argument('--classes', type=str, default=None,
+                        help=f"Comma-separated classes for --file (from {', '.join(CHARACTER_CLASSES)})")
+    parser.add_argument('--chars', type=str, help='Also count this custom set of characters (with --file)')
     parser.add_argument('--test', action='store_true', help='Run self-tests')
     args = parser.parse_args()
 
@@ -83,6 +181,24 @@ def main() -> None:
         run_tests()
         return
 
+    if args.file:
+        names = args.classes.split(',') if args.classes else ['vowels_y' if args.include_y else 'vowels']
+        try:
+            classes = {name: CHARACTER_CLASSES[name] for name in names}
+        except KeyError as exc:
+            print(f'Unknown character class: {exc}. Choose from {list(CHARACTER_CLASSES)}')
+            return
+        if args.chars:
+            classes['custom'] = args.chars
+        try:
+            totals = count_file(args.file, classes)
+        except (OSError, ValueError) as exc:
+            print(f'Error: {exc}')
+            return
+        for name, c in totals.items():
+            print(f'  {name}: {c}')
+        return
+
     try:
         text = input('Enter a string (or press Enter for empty): ')
     except EOFError:
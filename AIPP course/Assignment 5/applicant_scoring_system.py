@@ -1,38 +1,151 @@
 """
 Job Applicant Scoring System with Bias Analysis
+
+Bias reports can also be streamed from CSV or JSONL files (columns gender,
+exp, edu, skills, cert) in constant memory: per-group statistics are kept
+with Welford's online mean/variance and the top scores in a bounded heap.
 """
 
+import csv
+import heapq
+import json
+import math
 from collections import defaultdict
 
+try:
+    import pandas as pd
+except ImportError:  # CSV streaming falls back to the csv module
+    pd = None
+
+SCORE_FIELDS = ('exp', 'edu', 'skills', 'cert')
+CHUNK_ROWS = 100_000
+
+
 def calculate_score(exp, edu, skills, cert):
+    # Plain arithmetic, so it also scores whole NumPy/pandas columns at once
     return exp * 10 + edu * 15 + skills * 20 + cert * 5
 
+
+class GroupStats:
+    """Running count, sum and Welford mean/M2 for one group's scores."""
+
+    __slots__ = ('count', 'total', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, score):
+        self.count += 1
+        self.total += score
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (score - self.mean)
+
+    @property
+    def average(self):
+        return self.total / self.count
+
+    @property
+    def std(self):
+        """Population standard deviation of the scores seen so far."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+class BiasReport:
+    """Constant-memory bias statistics: O(groups) stats plus a top-k heap."""
+
+    def __init__(self, top_k=5):
+        self.top_k = top_k
+        self.groups = defaultdict(GroupStats)
+        self._top = []  # min-heap of (score, -sequence, gender)
+        self._seq = 0
+
+    def add(self, gender, score):
+        self.groups[gender].add(score)
+        # ties keep the earlier applicant, like a stable sort would
+        item = (score, -self._seq, gender)
+        self._seq += 1
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, item)
+        elif item > self._top[0]:
+            heapq.heapreplace(self._top, item)
+
+    def top(self):
+        """Return [(gender, score)] for the top-k scores, highest first."""
+        return [(g, s) for s, _, g in sorted(self._top, reverse=True)]
+
+    def print_report(self):
+        print("\n" + "=" * 50)
+        print("BIAS ANALYSIS")
+        print("=" * 50)
+        print("\nGender Statistics:")
+        for gender, st in self.groups.items():
+            print(f"  {gender}: Avg = {st.average:.2f}, Std = {st.std:.2f}, Count = {st.count}")
+
+        male = self.groups.get('Male')
+        female = self.groups.get('Female')
+        if male and female:
+            diff = abs(male.average - female.average)
+            print(f"\nGender Difference: {diff:.2f}")
+            print("⚠️  Bias detected!" if diff > 10 else "✓ No significant bias.")
+
+        print(f"\nTop {self.top_k} Scores:")
+        for i, (gender, score) in enumerate(self.top(), 1):
+            print(f"  {i}. {gender}: {score}")
+
+
 def analyze_bias(apps):
-    print("\n" + "=" * 50)
-    print("BIAS ANALYSIS")
-    print("=" * 50)
-    gender_stats = defaultdict(list)
+    report = BiasReport()
     for app in apps:
-        gender_stats[app['gender']].append(app['score'])
-    
-    print("\nGender Statistics:")
-    for gender, scores in gender_stats.items():
-        print(f"  {gender}: Avg = {sum(scores)/len(scores):.2f}, Count = {len(scores)}")
-    
-    male = gender_stats.get('Male', [])
-    female = gender_stats.get('Female', [])
-    if male and female:
-        diff = abs(sum(male)/len(male) - sum(female)/len(female))
-        print(f"\nGender Difference: {diff:.2f}")
-        print("⚠️  Bias detected!" if diff > 10 else "✓ No significant bias.")
-    
-    print(f"\nTop 5 Scores:")
-    for i, app in enumerate(sorted(apps, key=lambda x: x['score'], reverse=True)[:5], 1):
-        print(f"  {i}. {app['gender']}: {app['score']}")
+        report.add(app['gender'], app['score'])
+    report.print_report()
+
+
+def iter_scored_csv(path, chunksize=CHUNK_ROWS):
+    """Yield (genders, scores) column chunks from a CSV, scoring each chunk vectorized."""
+    if pd is not None:
+        with pd.read_csv(path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                scores = calculate_score(*(chunk[f].to_numpy() for f in SCORE_FIELDS))
+                yield chunk['gender'].tolist(), scores.tolist()
+        return
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield [row['gender']], [calculate_score(*(int(row[k]) for k in SCORE_FIELDS))]
+
+
+def iter_scored_jsonl(path):
+    """Yield (genders, scores) one applicant at a time from a JSON-lines file."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                app = json.loads(line)
+                yield [app['gender']], [calculate_score(*(app[k] for k in SCORE_FIELDS))]
+
+
+def stream_bias_report(path, top_k=5):
+    """Build a BiasReport from a .csv or .jsonl file without loading it."""
+    chunks = iter_scored_jsonl(path) if path.endswith('.jsonl') else iter_scored_csv(path)
+    report = BiasReport(top_k)
+    for genders, scores in chunks:
+        for gender, score in zip(genders, scores):
+            report.add(gender, score)
+    return report
+
 
 def main():
     print("APPLICANT SCORING SYSTEM")
-    choice = input("Enter manually? (y/n, 'n' for sample): ").lower()
+    choice = input("Enter manually? (y/n, 'n' for sample, or a .csv/.jsonl path): ").strip()
+    if choice.lower().endswith(('.csv', '.jsonl')):
+        try:
+            stream_bias_report(choice).print_report()
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Could not read applicants: {e}")
+        return
+    choice = choice.lower()
     
     apps = []
     if choice == 'y':
@@ -64,5 +177,6 @@ def main():
     if apps:
         analyze_bias(apps)
 
+
 if __name__ == "__main__":
     main()
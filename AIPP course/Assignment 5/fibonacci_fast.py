@@ -0,0 +1,168 @@
+"""
+Fast Fibonacci Engine
+This module complements fibonacci_recursive.py with implementations that
+scale to huge n:
+- fib(n): fast doubling, O(log n) big-integer multiplications
+- fib_mod(n, m): fast doubling modulo m, for astronomically large n
+- fib_range(start, stop): generator over F(start)..F(stop-1) in O(1) memory
+- fib_memo(n): lru_cache-backed recursion, kept only for comparison
+A benchmark harness (run this file) prints timings so the crossover points
+between the approaches can be read off.
+"""
+import sys
+import time
+from functools import lru_cache
+
+from fibonacci_recursive import fibonacci as fib_naive
+
+
+def _check_n(n):
+    if not isinstance(n, int):
+        raise TypeError("n must be an integer")
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+
+
+def _fib_pair(n):
+    """
+    Return (F(n), F(n+1)) by fast doubling over the bits of n:
+    - F(2k)   = F(k) * (2*F(k+1) - F(k))
+    - F(2k+1) = F(k)^2 + F(k+1)^2
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib(n):
+    """
+    Calculate the nth Fibonacci number with fast doubling.
+
+    Raises:
+        ValueError: If n is negative.
+
+    Examples:
+        >>> fib(10)
+        55
+        >>> fib(100)
+        354224848179261915075
+    """
+    _check_n(n)
+    return _fib_pair(n)[0]
+
+
+def fib_mod(n, m):
+    """
+    Calculate F(n) mod m without building F(n); n may have thousands of digits.
+
+    Raises:
+        ValueError: If n is negative or m is not positive.
+
+    Examples:
+        >>> fib_mod(10, 7)
+        6
+        >>> fib_mod(10**18, 1_000_000_007)
+        209783453
+    """
+    _check_n(n)
+    if m <= 0:
+        raise ValueError("m must be a positive integer")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a % m
+
+
+def fib_range(start, stop):
+    """
+    Yield F(start), F(start+1), ..., F(stop-1) holding only two numbers at a time.
+
+    Examples:
+        >>> list(fib_range(5, 10))
+        [5, 8, 13, 21, 34]
+    """
+    _check_n(start)
+    if stop <= start:
+        return
+    a, b = _fib_pair(start)
+    for _ in range(stop - start):
+        yield a
+        a, b = b, a + b
+
+
+@lru_cache(maxsize=None)
+def fib_memo(n):
+    """
+    Memoized recursive Fibonacci (for comparison only: O(n) time and memory,
+    and limited by Python's recursion limit).
+    """
+    _check_n(n)
+    if n < 2:
+        return n
+    return fib_memo(n - 1) + fib_memo(n - 2)
+
+
+def fib_iterative(n):
+    """Simple O(n) loop, used in the benchmark."""
+    _check_n(n)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def _time(func, n, repeat=3):
+    """Return the best wall time of func(n) over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        if func is fib_memo:
+            fib_memo.cache_clear()
+        start = time.perf_counter()
+        func(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(sizes=(10, 20, 25, 100, 500, 1000, 10_000, 100_000, 1_000_000)):
+    """
+    Time each implementation at each n and return {n: {name: seconds}}.
+    Implementations are skipped where they would take far too long
+    (naive above 25) or exceed the recursion limit (memo above 500).
+    """
+    limits = {"naive": 25, "memo": 500, "iterative": 100_000, "doubling": None}
+    funcs = {"naive": fib_naive, "memo": fib_memo, "iterative": fib_iterative, "doubling": fib}
+    results = {}
+    for n in sizes:
+        row = {}
+        for name, func in funcs.items():
+            limit = limits[name]
+            if limit is None or n <= limit:
+                row[name] = _time(func, n)
+        results[n] = row
+    return results
+
+
+def main():
+    """Print the benchmark table; the fastest entry per row marks the crossover."""
+    # fib_memo recurses n levels deep (two frames per level with lru_cache)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 5000))
+    names = ["naive", "memo", "iterative", "doubling"]
+    print(f"{'n':>9} " + " ".join(f"{name:>12}" for name in names) + "   fastest")
+    for n, row in benchmark().items():
+        cells = " ".join(f"{row[name]:>12.6f}" if name in row else f"{'-':>12}" for name in names)
+        print(f"{n:>9} {cells}   {min(row, key=row.get)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,7 @@ def fibonacci(n):
     Note:
         This recursive implementation has exponential time complexity O(2^n),
         making it inefficient for large values of n. For production use,
-        consider iterative or memoized versions.
+        see fib() in fibonacci_fast.py (fast doubling, O(log n)).
     """
     # Base case 1: If n is 0, return 0 (first Fibonacci number)
     if n == 0:
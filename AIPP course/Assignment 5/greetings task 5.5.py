@@ -1,47 +1,220 @@
+"""
+Inclusive greetings.
+
+Single records: normalize_gender() and greet_user().
+Batch mode (mail merge): greet_many() renders whole columns, and
+greet_csv() streams a CSV of names/genders to a greetings file through one
+buffered writer. The gender term sets and the titles are built once at
+import time, and each distinct raw spelling is normalized once and cached, so
+a column of millions of values costs one dict lookup per row. The greeting
+template is a single f-string, which CPython compiles to one string-building
+step (faster than str.format or string.Template).
+
+    python "greetings task 5.5.py"                                   # interactive
+    python "greetings task 5.5.py" --input-csv customers.csv --output greetings.txt
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+from typing import Iterable, List
+
+MALE_TERMS = frozenset({"m", "male", "man", "boy"})
+FEMALE_TERMS = frozenset({"f", "female", "woman", "girl"})
+NEUTRAL_TERMS = frozenset({
+    "nb", "enby", "nonbinary", "non-binary",
+    "gender-neutral", "gender neutral", "neutral", "x", "mx"
+})
+NONE_TERMS = frozenset({
+    "", "na", "n/a", "none", "prefer not to say",
+    "unspecified", "unknown", "skip"
+})
+
+TITLES = {
+    "male": "Mr.",
+    "female": "Ms.",
+    "neutral": "Mx.",
+    "none": ""  # No title used
+}
+
+# raw gender spelling -> canonical key; bounded so free-text columns cannot grow it forever
+_GENDER_CACHE = {}
+_GENDER_CACHE_MAX = 4096
+
+
 def normalize_gender(raw: str) -> str:
     """Map many user inputs to canonical keys: male, female, neutral, none."""
+    key = _GENDER_CACHE.get(raw)
+    if key is not None:
+        return key
     g = (raw or "").strip().lower()
 
-    male_terms = {"m", "male", "man", "boy"}
-    female_terms = {"f", "female", "woman", "girl"}
-    neutral_terms = {
-        "nb", "enby", "nonbinary", "non-binary",
-        "gender-neutral", "gender neutral", "neutral", "x", "mx"
-    }
-    none_terms = {
-        "", "na", "n/a", "none", "prefer not to say",
-        "unspecified", "unknown", "skip"
-    }
-
-    if g in male_terms:
-        return "male"
-    if g in female_terms:
-        return "female"
-    if g in neutral_terms:
-        return "neutral"
-    if g in none_terms:
-        return "none"
-    # Fallback to neutral if it's something else
-    return "neutral"
+    if g in MALE_TERMS:
+        key = "male"
+    elif g in FEMALE_TERMS:
+        key = "female"
+    elif g in NEUTRAL_TERMS:
+        key = "neutral"
+    elif g in NONE_TERMS:
+        key = "none"
+    else:
+        # Fallback to neutral if it's something else
+        key = "neutral"
+
+    if raw is not None and len(_GENDER_CACHE) < _GENDER_CACHE_MAX:
+        _GENDER_CACHE[raw] = key
+    return key
 
 
 def greet_user(name: str, gender: str) -> str:
     """Return an inclusive greeting with an appropriate title."""
-    titles = {
-        "male": "Mr.",
-        "female": "Ms.",
-        "neutral": "Mx.",
-        "none": ""  # No title used
-    }
     key = normalize_gender(gender)
-    title = titles.get(key, "Mx.")
+    title = TITLES.get(key, "Mx.")
+    space = " " if title else ""
+    return f"Hello, {title}{space}{name}! Welcome."
+
+
+def greet_many(names: Iterable[str], genders: Iterable[str]) -> List[str]:
+    """Greetings for two parallel columns (same result as greet_user per row)."""
+    genders = genders if isinstance(genders, list) else list(genders)
+    # Resolve each distinct spelling once (title plus its space), then render
+    # every row with a plain dict lookup
+    prefixes = {}
+    for g in set(genders):
+        title = TITLES.get(normalize_gender(g), "Mx.")
+        prefixes[g] = f"{title} " if title else ""
+    return [f"Hello, {prefixes[g]}{name}! Welcome." for name, g in zip(names, genders)]
+
+
+def write_greetings(names: Iterable[str], genders: Iterable[str], out) -> int:
+    """Write one greeting per line to an open text file. Returns the number written."""
+    greetings = greet_many(names, genders)
+    if greetings:
+        out.write("\n".join(greetings))
+        out.write("\n")
+    return len(greetings)
+
+
+def greet_csv(input_path: str, output_path: str, name_column: str = "name",
+              gender_column: str = "gender", chunk_rows: int = 100_000) -> int:
+    """
+    Stream a CSV of customers into a file of greetings, one per line.
+    Rows are rendered chunk_rows at a time and written through one buffered writer.
+    Returns the number of greetings written.
+    """
+    written = 0
+    with open(input_path, newline="", encoding="utf-8") as src, \
+            open(output_path, "w", encoding="utf-8", buffering=1 << 20) as out:
+        reader = csv.reader(src)
+        header = next(reader, [])
+        try:
+            name_index = header.index(name_column)
+            gender_index = header.index(gender_column)
+        except ValueError:
+            raise ValueError(f"{input_path} needs '{name_column}' and '{gender_column}' columns") from None
+        width = max(name_index, gender_index) + 1
+        names, genders = [], []
+        for row in reader:
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            names.append(row[name_index])
+            genders.append(row[gender_index])
+            if len(names) >= chunk_rows:
+                written += write_greetings(names, genders, out)
+                names, genders = [], []
+        written += write_greetings(names, genders, out)
+    return written
+
+
+def run_tests() -> None:
+    """Check greet_many() and a greet_csv() round trip against greet_user() per row."""
+    rows = [("Ada", "F"), ("Alan", " male "), ("Sam", "Non-Binary"), ("Kim", ""),
+            ("Lee", "prefer not to say"), ("O'Neil, Jr.", "x"), ("Zoë", "something else"),
+            ("Pat", None)]
+    names = [name for name, _ in rows]
+    genders = [gender for _, gender in rows]
+    assert greet_many(names, genders) == [greet_user(name, gender) for name, gender in rows]
+
+    # CSV cells cannot hold None, and a short row has no gender at all: both read back as ""
+    expected = [greet_user(name, gender or "") for name, gender in rows] + [greet_user("Short", "")]
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "customers.csv")
+        output_path = os.path.join(tmp, "greetings.txt")
+        with open(input_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "name", "gender"])
+            for i, (name, gender) in enumerate(rows):
+                writer.writerow([i, name, gender])
+            writer.writerow([len(rows), "Short"])
+        # A small chunk size so the round trip crosses chunk boundaries
+        count = greet_csv(input_path, output_path, chunk_rows=3)
+        with open(output_path, encoding="utf-8") as f:
+            written = f.read().split("\n")[:-1]
+    assert count == len(expected) and written == expected
+    print(f"All {len(rows)} greeting cases passed (greet_many and greet_csv).")
+
+
+def _reference_greet_user(name: str, gender: str) -> str:
+    """The original per-record builder, kept for the benchmark."""
+    g = (gender or "").strip().lower()
+    if g in {"m", "male", "man", "boy"}:
+        key = "male"
+    elif g in {"f", "female", "woman", "girl"}:
+        key = "female"
+    elif g in {"", "na", "n/a", "none", "prefer not to say", "unspecified", "unknown", "skip"}:
+        key = "none"
+    else:
+        key = "neutral"
+    title = TITLES.get(key, "Mx.")
     space = " " if title else ""
     return f"Hello, {title}{space}{name}! Welcome."
 
 
+def benchmark(n: int = 1_000_000) -> None:
+    """Time the original per-record builder against greet_many on n rows."""
+    spellings = ["Male", "f", "Non-Binary", "", " woman ", "prefer not to say", "X", "boy"]
+    names = [f"Customer {i}" for i in range(n)]
+    genders = [spellings[i % len(spellings)] for i in range(n)]
+
+    start = time.perf_counter()
+    expected = [_reference_greet_user(name, g) for name, g in zip(names, genders)]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = greet_many(names, genders)
+    batch_time = time.perf_counter() - start
+
+    assert batch == expected
+    print(f"{n:,} greetings: per-record {reference_time:.2f}s, greet_many {batch_time:.2f}s "
+          f"({reference_time / batch_time:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inclusive greetings")
+    parser.add_argument("--input-csv", help="Greet every row of this CSV (batch mode)")
+    parser.add_argument("--output", default="greetings.txt", help="Greetings file for --input-csv")
+    parser.add_argument("--name-column", default="name")
+    parser.add_argument("--gender-column", default="gender")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Compare per-record and batch rendering")
+    parser.add_argument("--test", action="store_true", help="Check the batch and CSV paths against greet_user")
+    args = parser.parse_args()
+
+    if args.test:
+        run_tests()
+    elif args.benchmark:
+        benchmark(args.benchmark)
+    elif args.input_csv:
+        count = greet_csv(args.input_csv, args.output, args.name_column, args.gender_column)
+        print(f"Wrote {count:,} greetings to {args.output}")
+    else:
+        name_input = input("Enter your name: ").strip() or "Friend"
+        gender_input = input(
+            "Enter your gender (male/female/non-binary/neutral/none or press Enter to skip): "
+        )
+        print(greet_user(name_input, gender_input))
+
+
 if __name__ == "__main__":
-    name_input = input("Enter your name: ").strip() or "Friend"
-    gender_input = input(
-        "Enter your gender (male/female/non-binary/neutral/none or press Enter to skip): "
-    )
-    print(greet_user(name_input, gender_input))
\ No newline at end of file
+    main()
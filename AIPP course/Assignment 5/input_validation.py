@@ -0,0 +1,172 @@
+"""
+Login Input Validation for SecureLoginSystem
+Validation rules are compiled once into a ValidationRules object:
+- The forbidden username characters become one precompiled regex
+  character class, so each check is a single C-level scan
+- Length limits are plain integer comparisons
+validate_many() checks whole batches (e.g. bulk registration imports);
+when no username in the batch contains a forbidden character, which is
+the usual case, one scan over the joined batch clears them all, and any
+matches are mapped back to their rows without re-scanning the rest.
+"""
+
+import re
+import time
+from typing import Iterable, List, Optional, Tuple
+
+DANGEROUS_CHARS = "<>\"'&;|`"
+_VALID = (True, "")
+
+
+class ValidationRules:
+    """A compiled set of username/password rules."""
+
+    def __init__(self, username_max: int = 50, password_min: int = 8, password_max: int = 128,
+                 dangerous_chars: str = DANGEROUS_CHARS):
+        self.username_max = username_max
+        self.password_min = password_min
+        self.password_max = password_max
+        self.dangerous_chars = dangerous_chars
+        self._dangerous = re.compile("[" + re.escape(dangerous_chars) + "]") if dangerous_chars else None
+        # Separator for the joined batch scan: any character that is not itself forbidden
+        self._separator = next(c for c in "\n\x00\x1f" if c not in dangerous_chars)
+
+    def _check(self, username: str, password: str, has_dangerous: Optional[bool] = None) -> Tuple[bool, str]:
+        # Same order (and so the same first error) as the original validate_input;
+        # has_dangerous=None means the character scan has not run yet and is done last
+        if not username or not username.strip():
+            return False, "Username cannot be empty"
+        if not password:
+            return False, "Password cannot be empty"
+        if len(username) > self.username_max:
+            return False, f"Username too long (max {self.username_max} characters)"
+        if len(password) < self.password_min:
+            return False, f"Password too short (minimum {self.password_min} characters)"
+        if len(password) > self.password_max:
+            return False, f"Password too long (max {self.password_max} characters)"
+        if has_dangerous is None:
+            has_dangerous = self.has_dangerous(username)
+        if has_dangerous:
+            return False, "Username contains invalid characters"
+        return _VALID
+
+    def has_dangerous(self, username: str) -> bool:
+        return self._dangerous is not None and self._dangerous.search(username) is not None
+
+    def validate(self, username: str, password: str) -> Tuple[bool, str]:
+        """
+        Validate one username/password pair
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        return self._check(username, password)
+
+    def validate_many(self, pairs: Iterable[Tuple[str, str]]) -> List[Tuple[bool, str]]:
+        """Validate (username, password) pairs; results are in input order."""
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        flagged = set()
+        if self._dangerous is not None:
+            separator = self._separator
+            # None (or empty) usernames join as "" and fail the emptiness check in _check
+            joined = separator.join([username or "" for username, _ in pairs])
+            if joined.count(separator) != len(pairs) - 1:
+                # A username contains the separator itself: check rows one by one
+                search = self._dangerous.search
+                flagged = {i for i, (username, _) in enumerate(pairs) if username and search(username)}
+            else:
+                # Map each match back to its row by counting separators since the previous match
+                index = last = 0
+                for match in self._dangerous.finditer(joined):
+                    index += joined.count(separator, last, match.start())
+                    last = match.start()
+                    flagged.add(index)
+
+        username_max, password_min, password_max = self.username_max, self.password_min, self.password_max
+        results = []
+        append = results.append
+        for i, (username, password) in enumerate(pairs):
+            # Inline fast path for valid rows; anything else gets the ordered error from _check
+            if (username and password and len(username) <= username_max
+                    and password_min <= len(password) <= password_max
+                    and i not in flagged and not username.isspace()):
+                append(_VALID)
+            else:
+                append(self._check(username, password, i in flagged))
+        return results
+
+
+DEFAULT_RULES = ValidationRules()
+
+
+def _reference_validate(username: str, password: str) -> Tuple[bool, str]:
+    """The original per-character validate_input, kept for the benchmark."""
+    if not username or not username.strip():
+        return False, "Username cannot be empty"
+    if not password:
+        return False, "Password cannot be empty"
+    if len(username) > 50:
+        return False, "Username too long (max 50 characters)"
+    if len(password) < 8:
+        return False, "Password too short (minimum 8 characters)"
+    if len(password) > 128:
+        return False, "Password too long (max 128 characters)"
+    dangerous_chars = ['<', '>', '"', "'", '&', ';', '|', '`']
+    if any(char in username for char in dangerous_chars):
+        return False, "Username contains invalid characters"
+    return True, ""
+
+
+def run_tests() -> None:
+    """Check validate() and validate_many() against the original checks."""
+    cases = [
+        ("alice", "Password1!"),
+        (None, "Password1!"),
+        ("", "Password1!"),
+        ("   ", "Password1!"),
+        ("bob", None),
+        ("bob", ""),
+        ("x" * 51, "Password1!"),
+        ("bob", "short"),
+        ("bob", "p" * 129),
+        ("bad<user>", "Password1!"),
+        ("bad<user>", "short"),
+        ("semi;colon", "Password1!"),
+    ]
+    expected = [_reference_validate(u, p) for u, p in cases]
+    assert [DEFAULT_RULES.validate(u, p) for u, p in cases] == expected
+    assert DEFAULT_RULES.validate_many(cases) == expected
+    assert DEFAULT_RULES.validate_many([]) == []
+    assert DEFAULT_RULES.validate(None, "Password1!") == (False, "Username cannot be empty")
+    print(f"All {len(cases)} validation cases passed.")
+
+
+def benchmark(n: int = 200_000) -> None:
+    """Compare the original checks with validate() and validate_many() on n generated pairs."""
+    pairs = [(f"user_{i:07d}@example.com", f"Password{i}!") for i in range(n)]
+    pairs[n // 2] = ("bad<user>", "Password1!")
+
+    start = time.perf_counter()
+    expected = [_reference_validate(u, p) for u, p in pairs]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [DEFAULT_RULES.validate(u, p) for u, p in pairs]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = DEFAULT_RULES.validate_many(pairs)
+    batch_time = time.perf_counter() - start
+
+    assert single == expected and batch == expected
+    print(f"Validating {n:,} username/password pairs:")
+    print(f"  original loop    {reference_time:.3f}s")
+    print(f"  validate()       {single_time:.3f}s")
+    print(f"  validate_many()  {batch_time:.3f}s")
+
+
+if __name__ == "__main__":
+    run_tests()
+    benchmark()
@@ -2,8 +2,244 @@
 Loan Approval System
 A fair loan approval system that evaluates applicants based on financial criteria only,
 regardless of name or gender.
+
+The approval rules live in one declarative table (LOAN_VALUES / LOAN_RULES /
+LOAN_CONDITIONS). Each rule's test is an expression over the applicant's
+fields that works on plain numbers and on NumPy columns alike, and its
+reason is a format template, so the scalar and batch paths share one source:
+- loan_approval() runs a function generated from the table, which checks
+  rules in the evaluator's current order and computes derived values
+  (interest rate, DTI, max loan) only when a rule first reads them
+- loan_approval_batch() evaluates the same expressions as vectorized masks
+  over a DataFrame (needs NumPy and pandas) and feeds the observed rejection
+  rates back, so the scalar order tracks which rules reject most often
 """
 
+import random
+import string
+import sys
+import time
+from collections import namedtuple
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # only loan_approval_batch needs these
+    np = pd = None
+
+APPROVED_CODE = "APPROVED"
+APPROVED_REASON = "Loan approved - all criteria met"
+
+# Applicant fields the rules may read, in loan_approval argument order
+APPLICANT_FIELDS = ("age", "income", "credit_score", "loan_amount", "employment_years")
+
+# A value derived from the applicant fields: `scalar` is a Python expression
+# for one applicant, `vector(columns)` computes it for NumPy columns.
+LoanValue = namedtuple("LoanValue", "name scalar vector")
+
+# A rejection rule: `test` is True when the applicant is rejected, `reason` is
+# a format template over the same names. has_rate says whether the interest
+# rate is already fixed when this rule fails; cost is the relative price of the test.
+LoanRule = namedtuple("LoanRule", "code test reason has_rate cost")
+
+# A condition attached to the decision; approved_only ones apply only to approvals.
+LoanCondition = namedtuple("LoanCondition", "text test approved_only")
+
+
+def _rate_vector(v):
+    credit_score = v["credit_score"]
+    return np.select(
+        [credit_score < 600, credit_score >= 750, credit_score >= 700, credit_score >= 650],
+        [0.0, 5.5, 6.5, 7.5],
+        9.0,
+    )
+
+
+def _dti_vector(v):
+    monthly_income = v["income"] / 12
+    monthly_payment = (v["loan_amount"] * (v["interest_rate"] / 100)) / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(monthly_income > 0, (monthly_payment / monthly_income) * 100, 100.0)
+
+
+LOAN_VALUES = [
+    # Credit tier -> interest rate (no rate below the 600 minimum)
+    LoanValue("interest_rate",
+              "0 if credit_score < 600 else 5.5 if credit_score >= 750 else 6.5 if credit_score >= 700"
+              " else 7.5 if credit_score >= 650 else 9.0",
+              _rate_vector),
+    # Monthly payment (interest only) against monthly income, in percent;
+    # same arithmetic order in both forms so the ratios match exactly
+    LoanValue("debt_to_income_ratio",
+              "((((loan_amount * (interest_rate / 100)) / 12) / (income / 12)) * 100"
+              " if income / 12 > 0 else 100)",
+              _dti_vector),
+    # Loan amount should not exceed 5 times annual income
+    LoanValue("max_loan_amount", "income * 5", lambda v: v["income"] * 5),
+]
+
+# Rules in decision order (gender and name are NOT used in decision-making).
+# When several rules fail, the first one in this table is the reported reason.
+LOAN_RULES = [
+    LoanRule("AGE_MIN", "age < 18",
+             "Applicant must be at least 18 years old", False, 1),
+    LoanRule("CREDIT_LOW", "credit_score < 600",
+             "Credit score too low (minimum 600 required)", True, 1),
+    LoanRule("EMPLOYMENT_SHORT", "employment_years < 1",
+             "Insufficient employment history (minimum 1 year required)", True, 1),
+    LoanRule("DTI_HIGH", "debt_to_income_ratio > 40",
+             "Debt-to-income ratio too high ({debt_to_income_ratio:.2f}%, maximum 40% allowed)", True, 3),
+    LoanRule("INCOME_LOW", "income < 30000",
+             "Annual income too low (minimum $30,000 required)", True, 1),
+    LoanRule("LOAN_TOO_HIGH", "loan_amount > max_loan_amount",
+             "Loan amount too high (maximum ${max_loan_amount:,.2f} allowed based on income)", True, 2),
+]
+
+LOAN_CONDITIONS = [
+    LoanCondition("Requires co-signer due to age", "age > 75", False),
+    LoanCondition("Requires additional documentation", "credit_score < 700", True),
+    LoanCondition("Employment verification required", "employment_years < 2", True),
+    LoanCondition("Higher risk category - standard terms apply", "debt_to_income_ratio > 30", True),
+]
+
+# Reason codes used by loan_approval_batch, in table order
+REASON_CODES = [rule.code for rule in LOAN_RULES]
+
+
+def _expression_names(expression):
+    return set(compile(expression, "<loan rule>", "eval").co_names)
+
+
+def _template_names(template):
+    return {field.split(".")[0].split("[")[0]
+            for _, field, _, _ in string.Formatter().parse(template) if field}
+
+
+class LoanRuleEvaluator:
+    """
+    Compiles a rule table into one scalar decision function.
+
+    Rules may be checked in any order: once some rule rejects, only the
+    earlier-listed rules not yet checked are evaluated to find the first
+    failing one in table order, so the decision and reason never depend on
+    the evaluation order. The generated code is straight-line ifs, derived
+    values are computed at their first use, and nothing is counted per call.
+    observe() takes rejection counts (e.g. from a batch run) and reorder()
+    recompiles with cheap, frequently-rejecting rules first.
+    """
+
+    def __init__(self, rules, conditions, values):
+        self.rules = list(rules)
+        self.conditions = list(conditions)
+        self.values = {value.name: value for value in values}
+        self.order = list(range(len(self.rules)))
+        self.observed = 0
+        self.rejections = [0] * len(self.rules)
+        self.source = ""
+        self.evaluate = None
+        self.compile()
+
+    # -- code generation -------------------------------------------------
+
+    def _emit_values(self, names, assigned, lines, indent):
+        """Emit assignments for the derived values in `names` (and their dependencies)."""
+        for name in sorted(names):
+            if name in self.values and name not in assigned:
+                value = self.values[name]
+                self._emit_values(_expression_names(value.scalar), assigned, lines, indent)
+                lines.append(f"{indent}{name} = {value.scalar}")
+                assigned.add(name)
+
+    def _emit_result(self, rule, assigned, lines, indent):
+        """Emit the return statement for a rejection by `rule` (None means approved)."""
+        approved = rule is None
+        needed = set()
+        if approved or rule.has_rate:
+            needed.add("interest_rate")
+        if not approved:
+            needed |= _template_names(rule.reason)
+        conditions = [c for c in self.conditions if approved or not c.approved_only]
+        for condition in conditions:
+            needed |= _expression_names(condition.test)
+        self._emit_values(needed, assigned, lines, indent)
+
+        lines.append(f"{indent}conditions = []")
+        for condition in conditions:
+            lines.append(f"{indent}if {condition.test}:")
+            lines.append(f"{indent}    conditions.append({condition.text!r})")
+        if approved:
+            reason, amount, rate = repr(APPROVED_REASON), "loan_amount", "interest_rate"
+        else:
+            reason = f"f{rule.reason!r}" if _template_names(rule.reason) else repr(rule.reason)
+            amount, rate = "0", "interest_rate" if rule.has_rate else "0"
+        lines.append(
+            f"{indent}return {{'name': name, 'gender': gender, 'approved': {approved}, "
+            f"'reason': {reason}, 'approved_amount': {amount}, 'interest_rate': {rate}, "
+            f"'conditions': conditions}}"
+        )
+
+    def _generate(self):
+        position = {index: k for k, index in enumerate(self.order)}
+        lines = [f"def evaluate(name, gender, {', '.join(APPLICANT_FIELDS)}):"]
+        assigned = set()
+        for k, index in enumerate(self.order):
+            rule = self.rules[index]
+            self._emit_values(_expression_names(rule.test), assigned, lines, "    ")
+            lines.append(f"    if {rule.test}:")
+            branch = set(assigned)
+            # Earlier-listed rules that the chosen order has not checked yet
+            for earlier in range(index):
+                if position[earlier] > k:
+                    earlier_rule = self.rules[earlier]
+                    self._emit_values(_expression_names(earlier_rule.test), branch, lines, "        ")
+                    lines.append(f"        if {earlier_rule.test}:")
+                    self._emit_result(earlier_rule, set(branch), lines, "            ")
+            self._emit_result(rule, branch, lines, "        ")
+        self._emit_result(None, assigned, lines, "    ")
+        return "\n".join(lines) + "\n"
+
+    def compile(self):
+        """(Re)generate the decision function for the current order."""
+        self.source = self._generate()
+        namespace = {}
+        exec(compile(self.source, "<loan rules>", "exec"), namespace)
+        self.evaluate = namespace["evaluate"]
+
+    # -- ordering --------------------------------------------------------
+
+    def observe(self, rejections, total):
+        """Add per-rule rejection counts (in table order) seen over `total` applicants."""
+        self.observed += total
+        for index, count in enumerate(rejections):
+            self.rejections[index] += int(count)
+
+    def reorder(self):
+        """Order rules by rejection rate per unit cost, highest first; recompile if it changed."""
+        if not self.observed:
+            return
+        order = sorted(range(len(self.rules)),
+                       key=lambda i: self.rejections[i] / self.observed / self.rules[i].cost,
+                       reverse=True)
+        if order != self.order:
+            self.order = order
+            self.compile()
+
+    def statistics(self):
+        """Return {rule code: {"rejections", "rate", "position"}}."""
+        return {
+            rule.code: {
+                "rejections": self.rejections[i],
+                "rate": self.rejections[i] / self.observed if self.observed else 0.0,
+                "position": self.order.index(i),
+            }
+            for i, rule in enumerate(self.rules)
+        }
+
+
+# Compiled once at import; loan_approval() routes every call through it
+LOAN_EVALUATOR = LoanRuleEvaluator(LOAN_RULES, LOAN_CONDITIONS, LOAN_VALUES)
+
+
 def loan_approval(name, gender, age, income, credit_score, loan_amount, employment_years):
     """
     Evaluates loan approval based on financial criteria only.
@@ -29,83 +265,84 @@ def loan_approval(name, gender, age, income, credit_score, loan_amount, employme
     --------
     dict : Approval decision with details
     """
-    # Initialize result dictionary
-    result = {
-        "name": name,
-        "gender": gender,
-        "approved": False,
-        "reason": "",
-        "approved_amount": 0,
-        "interest_rate": 0,
-        "conditions": []
+    return LOAN_EVALUATOR.evaluate(name, gender, age, income, credit_score, loan_amount, employment_years)
+
+
+def loan_approval_batch(df, evaluator=LOAN_EVALUATOR):
+    """
+    Vectorized loan_approval over a DataFrame of applicants.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Columns age, income, credit_score, loan_amount, employment_years,
+        and optionally name and gender (carried through unchanged).
+    evaluator : LoanRuleEvaluator
+        Rule table to apply; the batch's rejection counts are fed back to it.
+
+    Returns:
+    --------
+    pandas.DataFrame : One row per applicant with columns approved,
+    reason_code, reason, approved_amount, interest_rate and conditions
+    (a list per row), matching loan_approval() for the same inputs.
+    """
+    if np is None:
+        raise RuntimeError("loan_approval_batch requires NumPy and pandas")
+
+    columns = {
+        "age": df["age"].to_numpy(),
+        "income": df["income"].to_numpy(dtype=float),
+        "credit_score": df["credit_score"].to_numpy(),
+        "loan_amount": df["loan_amount"].to_numpy(dtype=float),
+        "employment_years": df["employment_years"].to_numpy(),
     }
-    
-    # Criteria evaluation (gender and name are NOT used in decision-making)
-    
-    # 1. Age check
-    if age < 18:
-        result["reason"] = "Applicant must be at least 18 years old"
-        return result
-    if age > 75:
-        result["conditions"].append("Requires co-signer due to age")
-    
-    # 2. Credit score check
-    if credit_score < 600:
-        result["reason"] = "Credit score too low (minimum 600 required)"
-        return result
-    elif credit_score >= 750:
-        result["interest_rate"] = 5.5  # Best rate
-    elif credit_score >= 700:
-        result["interest_rate"] = 6.5
-    elif credit_score >= 650:
-        result["interest_rate"] = 7.5
-    else:
-        result["interest_rate"] = 9.0  # Higher rate for lower scores
-    
-    # 3. Employment stability check
-    if employment_years < 1:
-        result["reason"] = "Insufficient employment history (minimum 1 year required)"
-        return result
-    
-    # 4. Debt-to-income ratio check
-    # Assuming monthly income = annual income / 12
-    monthly_income = income / 12
-    # Estimated monthly payment (principal + interest)
-    monthly_payment = (loan_amount * (result["interest_rate"] / 100)) / 12
-    
-    # Debt-to-income ratio should be less than 40%
-    debt_to_income_ratio = (monthly_payment / monthly_income) * 100 if monthly_income > 0 else 100
-    
-    if debt_to_income_ratio > 40:
-        result["reason"] = f"Debt-to-income ratio too high ({debt_to_income_ratio:.2f}%, maximum 40% allowed)"
-        return result
-    
-    # 5. Income requirement
-    if income < 30000:
-        result["reason"] = "Annual income too low (minimum $30,000 required)"
-        return result
-    
-    # 6. Loan amount check
-    # Loan amount should not exceed 5 times annual income
-    max_loan_amount = income * 5
-    if loan_amount > max_loan_amount:
-        result["reason"] = f"Loan amount too high (maximum ${max_loan_amount:,.2f} allowed based on income)"
-        return result
-    
-    # All criteria passed - loan approved
-    result["approved"] = True
-    result["approved_amount"] = loan_amount
-    result["reason"] = "Loan approved - all criteria met"
-    
-    # Additional conditions based on risk factors
-    if credit_score < 700:
-        result["conditions"].append("Requires additional documentation")
-    if employment_years < 2:
-        result["conditions"].append("Employment verification required")
-    if debt_to_income_ratio > 30:
-        result["conditions"].append("Higher risk category - standard terms apply")
-    
-    return result
+    for value in evaluator.values.values():
+        columns[value.name] = value.vector(columns)
+
+    rules = evaluator.rules
+    masks = [np.asarray(eval(rule.test, {}, columns), dtype=bool) for rule in rules]
+    reason_code = np.select(masks, [rule.code for rule in rules], APPROVED_CODE)
+    approved = reason_code == APPROVED_CODE
+
+    reason = pd.Series(APPROVED_REASON, index=df.index, dtype=object)
+    interest_rate = np.where(approved, columns["interest_rate"], 0.0)
+    for rule in rules:
+        rows = reason_code == rule.code
+        if not rows.any():
+            continue
+        fields = sorted(_template_names(rule.reason))
+        if fields:
+            picked = [columns[field][rows] for field in fields]
+            reason[rows] = [rule.reason.format(**dict(zip(fields, row))) for row in zip(*picked)]
+        else:
+            reason[rows] = rule.reason
+        if rule.has_rate:
+            interest_rate[rows] = columns["interest_rate"][rows]
+
+    # Each applicant's conditions form a bit pattern; map patterns to lists
+    flags = np.zeros(len(df), dtype=np.int64)
+    for bit, condition in enumerate(evaluator.conditions):
+        mask = np.asarray(eval(condition.test, {}, columns), dtype=bool)
+        if condition.approved_only:
+            mask &= approved
+        flags |= mask.astype(np.int64) << bit
+    patterns = [[c.text for bit, c in enumerate(evaluator.conditions) if code >> bit & 1]
+                for code in range(1 << len(evaluator.conditions))]
+
+    evaluator.observe([mask.sum() for mask in masks], len(df))
+    evaluator.reorder()
+
+    out = pd.DataFrame(index=df.index)
+    for col in ("name", "gender"):
+        if col in df:
+            out[col] = df[col]
+    out["approved"] = approved
+    out["reason_code"] = reason_code
+    out["reason"] = reason
+    out["approved_amount"] = np.where(approved, columns["loan_amount"], 0)
+    out["interest_rate"] = interest_rate
+    out["conditions"] = [list(patterns[code]) for code in flags]
+    return out
 
 
 def display_result(result):
@@ -204,6 +441,97 @@ def test_multiple_applicants():
         if result['approved']:
             print(f"  Interest Rate: {result['interest_rate']:.2f}%")
 
+    if pd is not None:
+        batch = loan_approval_batch(pd.DataFrame(test_cases))
+        scalar = [loan_approval(**applicant) for applicant in test_cases]
+        same = all(
+            row.approved == r["approved"] and row.reason == r["reason"]
+            and row.interest_rate == r["interest_rate"] and row.conditions == r["conditions"]
+            for row, r in zip(batch.itertuples(), scalar)
+        )
+        print(f"\nBatch engine agrees with per-applicant results: {'yes' if same else 'NO'}")
+
+
+def _reference_loan_approval(name, gender, age, income, credit_score, loan_amount, employment_years):
+    """The original if-chain loan_approval, kept for the benchmark."""
+    result = {"name": name, "gender": gender, "approved": False, "reason": "",
+              "approved_amount": 0, "interest_rate": 0, "conditions": []}
+    if age < 18:
+        result["reason"] = "Applicant must be at least 18 years old"
+        return result
+    if age > 75:
+        result["conditions"].append("Requires co-signer due to age")
+    if credit_score < 600:
+        result["reason"] = "Credit score too low (minimum 600 required)"
+        return result
+    elif credit_score >= 750:
+        result["interest_rate"] = 5.5
+    elif credit_score >= 700:
+        result["interest_rate"] = 6.5
+    elif credit_score >= 650:
+        result["interest_rate"] = 7.5
+    else:
+        result["interest_rate"] = 9.0
+    if employment_years < 1:
+        result["reason"] = "Insufficient employment history (minimum 1 year required)"
+        return result
+    monthly_income = income / 12
+    monthly_payment = (loan_amount * (result["interest_rate"] / 100)) / 12
+    debt_to_income_ratio = (monthly_payment / monthly_income) * 100 if monthly_income > 0 else 100
+    if debt_to_income_ratio > 40:
+        result["reason"] = f"Debt-to-income ratio too high ({debt_to_income_ratio:.2f}%, maximum 40% allowed)"
+        return result
+    if income < 30000:
+        result["reason"] = "Annual income too low (minimum $30,000 required)"
+        return result
+    max_loan_amount = income * 5
+    if loan_amount > max_loan_amount:
+        result["reason"] = f"Loan amount too high (maximum ${max_loan_amount:,.2f} allowed based on income)"
+        return result
+    result["approved"] = True
+    result["approved_amount"] = loan_amount
+    result["reason"] = "Loan approved - all criteria met"
+    if credit_score < 700:
+        result["conditions"].append("Requires additional documentation")
+    if employment_years < 2:
+        result["conditions"].append("Employment verification required")
+    if debt_to_income_ratio > 30:
+        result["conditions"].append("Higher risk category - standard terms apply")
+    return result
+
+
+def _random_applicants(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        ("A", "other", rng.randint(16, 80), rng.choice([0, rng.uniform(10000, 150000)]),
+         rng.randint(450, 850), rng.uniform(1000, 600000), rng.randint(0, 10))
+        for _ in range(n)
+    ]
+
+
+def benchmark(n=100_000, repeat=5):
+    """Time the original if-chain against loan_approval on n random applicants (best of repeat)."""
+    applicants = _random_applicants(n)
+    for args in applicants:
+        assert loan_approval(*args) == _reference_loan_approval(*args)
+
+    def best(func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for args in applicants:
+                func(*args)
+            timings.append(time.perf_counter() - start)
+        return min(timings) / n * 1e6
+
+    print(f"{n:,} applicants, microseconds per call (best of {repeat}):")
+    print(f"  original if-chain     {best(_reference_loan_approval):.2f}")
+    print(f"  loan_approval         {best(loan_approval):.2f}  (order: {', '.join(REASON_CODES[i] for i in LOAN_EVALUATOR.order)})")
+    if pd is not None:
+        fields = ("name", "gender") + APPLICANT_FIELDS
+        loan_approval_batch(pd.DataFrame(applicants, columns=fields))
+        print(f"  after batch reorder   {best(loan_approval):.2f}  (order: {', '.join(REASON_CODES[i] for i in LOAN_EVALUATOR.order)})")
+
 
 def main():
     """Main function to run the loan approval system."""
@@ -243,5 +571,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
 
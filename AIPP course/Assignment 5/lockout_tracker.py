@@ -0,0 +1,168 @@
+"""
+In-Memory Lockout Tracker for SecureLoginSystem
+Keeps failed-attempt counters and account lockouts in memory so the
+login failure path never writes to the credential store:
+- Counters and locked_until times live in dicts (O(1) checks)
+- Lock expiries sit in a min-heap and are purged lazily, so each lockout
+  is pushed and popped once no matter how often it is checked
+- Changed users are written back in one batch by flush(), at most once
+  per flush_interval (or on demand)
+"""
+
+import heapq
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class LockoutTracker:
+    """
+    Failed-attempt and lockout state for every user with a non-zero counter.
+    Users that are not tracked have 0 failed attempts and are not locked.
+    """
+
+    def __init__(self, max_attempts: int = 3, lockout_duration: float = 300,
+                 flush_interval: float = 5.0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            max_attempts: Failed attempts that trigger a lockout
+            lockout_duration: Lockout length in seconds
+            flush_interval: Minimum seconds between automatic flushes
+            clock: Wall-clock source; locked_until values are persisted, so this
+                   must be comparable across restarts (time.time by default)
+        """
+        self.max_attempts = max_attempts
+        self.lockout_duration = lockout_duration
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self.attempts: Dict[str, int] = {}
+        self.locked_until: Dict[str, float] = {}
+        self._expiries: List[Tuple[float, str]] = []  # min-heap of (locked_until, username)
+        self._dirty: Set[str] = set()
+        self._last_flush = clock()
+
+    def load(self, records: Iterable[Tuple[str, Dict]]) -> None:
+        """Seed the tracker from (username, record) pairs read from a user store."""
+        for username, record in records:
+            attempts = record.get("failed_attempts") or 0
+            locked_until = record.get("locked_until")
+            if attempts:
+                self.attempts[username] = attempts
+            if locked_until is not None:
+                self.locked_until[username] = locked_until
+                heapq.heappush(self._expiries, (locked_until, username))
+        self.expire()
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Clear every lockout that has run out by `now`. Heap entries whose
+        lock was replaced or reset in the meantime are dropped without effect.
+        Returns the number of accounts unlocked.
+        """
+        if now is None:
+            now = self.clock()
+        unlocked = 0
+        heap = self._expiries
+        while heap and heap[0][0] <= now:
+            until, username = heapq.heappop(heap)
+            if self.locked_until.get(username) == until:
+                # Lockout expired: start the user again from zero attempts
+                del self.locked_until[username]
+                self.attempts.pop(username, None)
+                self._dirty.add(username)
+                unlocked += 1
+        return unlocked
+
+    def is_locked(self, username: str, now: Optional[float] = None) -> bool:
+        """True while the user's lockout is still running."""
+        until = self.locked_until.get(username)
+        if until is None:
+            return False
+        if now is None:
+            now = self.clock()
+        if now < until:
+            return True
+        self.expire(now)
+        return False
+
+    def remaining(self, username: str, now: Optional[float] = None) -> float:
+        """Seconds left on the user's lockout (0 if not locked)."""
+        until = self.locked_until.get(username)
+        if until is None:
+            return 0.0
+        return max(0.0, until - (self.clock() if now is None else now))
+
+    def record_failure(self, username: str, now: Optional[float] = None) -> Tuple[int, Optional[float]]:
+        """
+        Count a failed attempt, locking the account once max_attempts is reached.
+        Returns (failed_attempts, locked_until).
+        """
+        if now is None:
+            now = self.clock()
+        attempts = self.attempts.get(username, 0) + 1
+        self.attempts[username] = attempts
+        locked_until = self.locked_until.get(username)
+        if attempts >= self.max_attempts:
+            locked_until = now + self.lockout_duration
+            self.locked_until[username] = locked_until
+            heapq.heappush(self._expiries, (locked_until, username))
+        self._dirty.add(username)
+        return attempts, locked_until
+
+    def reset(self, username: str) -> None:
+        """Forget the user's failed attempts and lockout (after a successful login)."""
+        had_attempts = self.attempts.pop(username, None) is not None
+        # The heap entry is left behind and ignored when it comes due
+        had_lock = self.locked_until.pop(username, None) is not None
+        if had_attempts or had_lock:
+            self._dirty.add(username)
+
+    def pending(self) -> Dict[str, Dict]:
+        """Field updates for every user changed since the last flush."""
+        return {
+            username: {
+                "failed_attempts": self.attempts.get(username, 0),
+                "locked_until": self.locked_until.get(username),
+            }
+            for username in self._dirty
+        }
+
+    def drain(self) -> Dict[str, Dict]:
+        """Return the pending updates and mark them flushed (the caller writes them)."""
+        self.expire()
+        changes = self.pending()
+        self._dirty.clear()
+        self._last_flush = self.clock()
+        return changes
+
+    def due(self) -> bool:
+        """True once flush_interval has passed since the last flush."""
+        return self.clock() - self._last_flush >= self.flush_interval
+
+    def flush(self, store) -> int:
+        """Write all pending changes to the store in one batch. Returns the number of users written."""
+        changes = self.drain()
+        if changes:
+            store.update_many(changes)
+        return len(changes)
+
+    def maybe_flush(self, store) -> int:
+        """Flush only if flush_interval has passed since the last flush."""
+        if not self.due():
+            return 0
+        return self.flush(store)
+
+
+def benchmark(n_users: int = 10_000, n_attempts: int = 200_000) -> float:
+    """Time failed attempts against the tracker alone. Returns attempts per second."""
+    tracker = LockoutTracker(flush_interval=float("inf"))
+    start = time.perf_counter()
+    for i in range(n_attempts):
+        username = f"user{(i * 7919) % n_users}"
+        if not tracker.is_locked(username):
+            tracker.record_failure(username)
+    elapsed = time.perf_counter() - start
+    return n_attempts / elapsed
+
+
+if __name__ == "__main__":
+    print(f"{benchmark():,.0f} failed attempts/second (in memory, no store writes)")
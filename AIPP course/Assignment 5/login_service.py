@@ -0,0 +1,320 @@
+"""
+Async Login Service for SecureLoginSystem
+An asyncio front-end that serves logins over the network without blocking:
+- Password verification (CPU-bound hashing) runs in a ProcessPoolExecutor
+- Store reads/writes run on one dedicated thread; concurrent lookups for
+  the same user share a single store read
+- Lockouts use the system's in-memory LockoutTracker, flushed periodically
+- Every login's latency is recorded and reported as p50/p95/p99
+The server speaks newline-delimited JSON over TCP. A load generator drives
+N concurrent clients against an in-memory stand-in store.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import math
+import os
+import random
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional
+
+from login_system_analysis import SecureLoginSystem
+from password_hashing import hasher_from_params
+from user_store import MemoryUserStore
+
+
+class LoginResult(NamedTuple):
+    success: bool
+    status: str  # "success", "invalid", "locked" or "invalid_input"
+    message: str
+
+
+def _verify_in_worker(params: Dict, password: str, hashed_password: str, salt_hex: str) -> bool:
+    """Runs in a worker process: rebuild the stored hasher and check the password."""
+    return hasher_from_params(params).verify(password, hashed_password, bytes.fromhex(salt_hex))
+
+
+def _hash_in_worker(params: Dict, password: str, salt: bytes) -> str:
+    """Runs in a worker process: hash a password with the given parameters."""
+    return hasher_from_params(params).hash(password, salt)
+
+
+class LatencyStats:
+    """Latency samples over a sliding window, summarised as percentiles."""
+
+    def __init__(self, window: int = 100_000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, p: float, ordered=None) -> float:
+        """Nearest-rank percentile in seconds (0 when there are no samples)."""
+        if ordered is None:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """p50/p95/p99/max in milliseconds plus the total number of samples."""
+        ordered = sorted(self.samples)
+        result = {f"p{p}_ms": self.percentile(p, ordered) * 1000 for p in (50, 95, 99)}
+        result["max_ms"] = (ordered[-1] if ordered else 0.0) * 1000
+        result["count"] = self.count
+        return result
+
+
+class AsyncLoginService:
+    """
+    Non-blocking login API over a SecureLoginSystem.
+    All methods must be awaited from the same event loop; the system's
+    lockout tracker is only touched from that loop.
+    """
+
+    def __init__(self, system: SecureLoginSystem, workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        """
+        Args:
+            system: Login system providing the store, hasher, lockouts and validation
+            workers: Verification processes (default: CPU count); ignored if executor is given
+            executor: Optional executor for hashing (e.g. a shared ProcessPoolExecutor)
+        """
+        self.system = system
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        # One thread keeps store access serialized (SQLite connections are not thread-safe)
+        self._store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="user-store")
+        self._lookups: Dict[str, asyncio.Future] = {}
+        self.latency = LatencyStats()
+        self.counters = Counter()
+
+    async def _store_call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._store_executor, functools.partial(func, *args, **kwargs))
+
+    async def _lookup(self, username: str) -> Optional[Dict]:
+        """Fetch a user record; callers asking for the same user meanwhile share the read."""
+        future = self._lookups.get(username)
+        if future is None:
+            future = asyncio.ensure_future(self._store_call(self.system.store.get, username))
+            self._lookups[username] = future
+            future.add_done_callback(lambda _: self._lookups.pop(username, None))
+        else:
+            self.counters["coalesced_lookups"] += 1
+        # shield: one caller being cancelled must not cancel the shared read
+        return await asyncio.shield(future)
+
+    async def _maybe_flush(self) -> None:
+        lockouts = self.system.lockouts
+        if lockouts.due():
+            changes = lockouts.drain()
+            if changes:
+                await self._store_call(self.system.store.update_many, changes)
+
+    async def _upgrade_hash(self, username: str, password: str) -> None:
+        """Rehash with the system's current hasher after a login with older parameters."""
+        loop = asyncio.get_running_loop()
+        params = self.system.hasher.params()
+        salt = os.urandom(32)
+        hashed = await loop.run_in_executor(self.executor, _hash_in_worker, params, password, salt)
+        await self._store_call(self.system.store.update, username,
+                               password_hash=hashed, salt=salt.hex(), hash_params=params)
+
+    def _locked_result(self, username: str) -> LoginResult:
+        remaining_time = int(self.system.lockouts.remaining(username))
+        minutes, seconds = divmod(remaining_time, 60)
+        return LoginResult(False, "locked", f"Account is locked. Try again in {minutes}m {seconds}s")
+
+    async def _login(self, username: str, password: str) -> LoginResult:
+        is_valid, error_msg = self.system.validate_input(username, password)
+        if not is_valid:
+            return LoginResult(False, "invalid_input", error_msg)
+
+        lockouts = self.system.lockouts
+        # Locked accounts are refused before any store read or hashing
+        if lockouts.is_locked(username):
+            return self._locked_result(username)
+
+        user = await self._lookup(username)
+        if user is None:
+            # Same message as a wrong password, so usernames cannot be enumerated
+            return LoginResult(False, "invalid", "Invalid credentials")
+
+        # Records without hash_params predate pluggable hashing: legacy SHA-256
+        stored_params = user.get("hash_params", {"scheme": "sha256"})
+        loop = asyncio.get_running_loop()
+        verified = await loop.run_in_executor(self.executor, _verify_in_worker, stored_params,
+                                              password, user["password_hash"], user["salt"])
+
+        # Another attempt may have locked the account while this one was hashing
+        if lockouts.is_locked(username):
+            return self._locked_result(username)
+
+        if verified:
+            lockouts.reset(username)
+            if stored_params != self.system.hasher.params():
+                await self._upgrade_hash(username, password)
+            await self._maybe_flush()
+            return LoginResult(True, "success", "Login successful")
+
+        failed_attempts, _ = lockouts.record_failure(username)
+        await self._maybe_flush()
+        if failed_attempts >= lockouts.max_attempts:
+            return LoginResult(False, "locked",
+                               f"Account locked due to {lockouts.max_attempts} failed attempts")
+        remaining = lockouts.max_attempts - failed_attempts
+        return LoginResult(False, "invalid", f"Invalid credentials. {remaining} attempt(s) remaining")
+
+    async def login(self, username: str, password: str) -> LoginResult:
+        """Log a user in without blocking the event loop. Never prints."""
+        start = time.perf_counter()
+        try:
+            result = await self._login(username, password)
+        finally:
+            self.latency.add(time.perf_counter() - start)
+        self.counters[result.status] += 1
+        return result
+
+    def stats(self) -> Dict:
+        """Latency percentiles (ms) and per-status counters."""
+        summary = self.latency.summary()
+        summary.update(self.counters)
+        return summary
+
+    async def close(self) -> None:
+        """Write pending lockout state and stop the worker pools."""
+        changes = self.system.lockouts.drain()
+        if changes:
+            await self._store_call(self.system.store.update_many, changes)
+        self._store_executor.shutdown(wait=True)
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+
+async def handle_client(service: AsyncLoginService, reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter) -> None:
+    """
+    One JSON object per line in each direction:
+        {"username": ..., "password": ...} -> {"success": ..., "status": ..., "message": ...}
+        {"op": "stats"}                    -> the service's stats()
+    """
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+                if request.get("op") == "stats":
+                    response = service.stats()
+                else:
+                    response = (await service.login(str(request.get("username", "")),
+                                                    str(request.get("password", ""))))._asdict()
+            except (ValueError, AttributeError):
+                response = {"success": False, "status": "invalid_input", "message": "Malformed request"}
+            writer.write(json.dumps(response).encode('utf-8') + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(service: AsyncLoginService, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Serve logins over TCP until cancelled."""
+    server = await asyncio.start_server(functools.partial(handle_client, service), host, port)
+    print(f"Login service listening on {host}:{port}")
+    async with server:
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
+
+
+async def run_load_test(clients: int = 50, requests_per_client: int = 20, users: int = 1000,
+                        scheme: str = "scrypt", store_latency: float = 0.002,
+                        hot_fraction: float = 0.2, workers: Optional[int] = None,
+                        seed: int = 0) -> Dict:
+    """
+    Drive `clients` concurrent clients against a MemoryUserStore with simulated
+    latency. A hot_fraction of requests target one shared user (exercising
+    lookup coalescing); one in ten of the others use a wrong password.
+    Returns the service stats plus overall throughput.
+    """
+    store = MemoryUserStore()
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = SecureLoginSystem(store=store, hasher=hasher_from_params({"scheme": scheme}))
+    password = "LoadTest123!"
+    record = system.new_user_record(password)
+    for i in range(users):
+        store.add(f"user{i}", record)
+    store.latency = store_latency
+
+    service = AsyncLoginService(system, workers=workers)
+    rng = random.Random(seed)
+
+    async def client(requests: int) -> None:
+        for _ in range(requests):
+            if rng.random() < hot_fraction:
+                await service.login("user0", password)
+            else:
+                username = f"user{rng.randrange(1, users)}"
+                await service.login(username, password if rng.random() >= 0.1 else "WrongPass999!")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(requests_per_client) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    await service.close()
+
+    stats = service.stats()
+    stats["logins_per_second"] = clients * requests_per_client / elapsed
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Async login service and load generator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    server_args = commands.add_parser("serve", help="Serve logins as newline-delimited JSON over TCP")
+    server_args.add_argument("--db", default="users.json", help="User store (.json or .db)")
+    server_args.add_argument("--host", default="127.0.0.1")
+    server_args.add_argument("--port", type=int, default=8765)
+    server_args.add_argument("--workers", type=int, default=None, help="Hashing processes")
+
+    bench_args = commands.add_parser("bench", help="Load-test against an in-memory stand-in store")
+    bench_args.add_argument("--clients", type=int, default=50)
+    bench_args.add_argument("--requests", type=int, default=20, help="Logins per client")
+    bench_args.add_argument("--users", type=int, default=1000)
+    bench_args.add_argument("--scheme", choices=["sha256", "pbkdf2_sha256", "scrypt"], default="scrypt")
+    bench_args.add_argument("--store-latency-ms", type=float, default=2.0)
+    bench_args.add_argument("--workers", type=int, default=None, help="Hashing processes")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        service = AsyncLoginService(SecureLoginSystem(args.db), workers=args.workers)
+        try:
+            asyncio.run(serve(service, args.host, args.port))
+        except KeyboardInterrupt:
+            print("\nStopped.")
+        return
+
+    print(f"Load test: {args.clients} clients x {args.requests} logins, scheme={args.scheme}")
+    stats = asyncio.run(run_load_test(args.clients, args.requests, args.users, args.scheme,
+                                      args.store_latency_ms / 1000, workers=args.workers))
+    print(f"Throughput: {stats['logins_per_second']:,.1f} logins/second")
+    print(f"Latency:    p50 {stats['p50_ms']:.1f} ms, p95 {stats['p95_ms']:.1f} ms, "
+          f"p99 {stats['p99_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
+    for key in ("success", "invalid", "locked", "coalesced_lookups"):
+        print(f"  {key:<18} {stats.get(key, 0):>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,18 @@ This program demonstrates an AI-generated login system with security vulnerabili
 analyzes the risks, and provides a secure version.
 """
 
-import hashlib
+import csv
 import getpass
 import os
 import json
 import re
-from typing import Dict, Optional, Tuple, List
-from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple, List
+from collections import Counter, defaultdict
+
+from input_validation import DEFAULT_RULES, ValidationRules
+from lockout_tracker import LockoutTracker
+from password_hashing import PasswordHasher, ScryptHasher, hasher_from_params
+from user_store import UserStore, open_user_store
 
 # ============================================================================
 # INSECURE VERSION (What an AI might generate without security awareness)
@@ -127,22 +132,32 @@ class SecureLoginSystem:
     Secure Login System with best practices
     """
     
-    def __init__(self, user_db_file: str = "users.json"):
+    def __init__(self, user_db_file: str = "users.json", store: Optional[UserStore] = None,
+                 hasher: Optional[PasswordHasher] = None, rules: Optional[ValidationRules] = None):
         """
         Initialize the secure login system
         
         Args:
-            user_db_file: Path to JSON file storing user credentials (hashed)
+            user_db_file: Path to the user database (hashed credentials).
+                          A .db/.sqlite file uses the SQLite store, anything else JSON.
+            store: Optional already-open UserStore (overrides user_db_file)
+            hasher: Password hasher for new hashes (default: scrypt); older
+                    hashes are upgraded to it on the user's next successful login
+            rules: Compiled input validation rules (default: DEFAULT_RULES)
         """
         self.user_db_file = user_db_file
-        self.failed_attempts = {}  # Track failed login attempts
+        self.hasher = hasher if hasher is not None else ScryptHasher()
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        self.store = store if store is not None else open_user_store(user_db_file)
         self.max_attempts = 3
         self.lockout_duration = 300  # 5 minutes in seconds
+        # Failed attempts and lockouts are tracked in memory and flushed to the store periodically
+        self.lockouts = LockoutTracker(self.max_attempts, self.lockout_duration)
         self.load_user_database()
     
     def hash_password(self, password: str, salt: Optional[bytes] = None) -> Tuple[str, bytes]:
         """
-        Hash a password using SHA-256 with salt
+        Hash a password with the configured hasher (scrypt by default) and a salt
         
         Args:
             password: Plain text password
@@ -154,17 +169,10 @@ class SecureLoginSystem:
         if salt is None:
             salt = os.urandom(32)  # Generate random salt
         
-        # Combine password and salt
-        password_bytes = password.encode('utf-8')
-        salted_password = password_bytes + salt
-        
-        # Hash the salted password
-        hash_object = hashlib.sha256(salted_password)
-        hashed_password = hash_object.hexdigest()
-        
-        return hashed_password, salt
+        return self.hasher.hash(password, salt), salt
     
-    def verify_password(self, password: str, hashed_password: str, salt: bytes) -> bool:
+    def verify_password(self, password: str, hashed_password: str, salt: bytes,
+                        params: Optional[Dict] = None) -> bool:
         """
         Verify a password against a stored hash
         
@@ -172,41 +180,47 @@ class SecureLoginSystem:
             password: Plain text password to verify
             hashed_password: Stored password hash
             salt: Salt used for the stored hash
+            params: Hash parameters stored with the hash (default: the current hasher's)
         
         Returns:
             True if password matches, False otherwise
         """
-        computed_hash, _ = self.hash_password(password, salt)
-        return computed_hash == hashed_password
+        hasher = self.hasher if params is None else hasher_from_params(params)
+        return hasher.verify(password, hashed_password, salt)
+    
+    def new_user_record(self, password: str) -> Dict:
+        """Build a fresh user record with a newly salted hash and its parameters"""
+        hashed, salt = self.hash_password(password)
+        return {
+            "password_hash": hashed,
+            "salt": salt.hex(),  # Store salt as hex string
+            "hash_params": self.hasher.params(),
+            "failed_attempts": 0,
+            "locked_until": None
+        }
     
     def load_user_database(self):
         """
-        Load user database from JSON file
-        Creates file with default admin user if it doesn't exist
+        Prepare the user database
+        Creates the default admin user if the store is empty
         """
-        if os.path.exists(self.user_db_file):
-            with open(self.user_db_file, 'r') as f:
-                self.users = json.load(f)
-        else:
+        if len(self.store) == 0:
             # Create default admin user (password: SecurePass123!)
             default_password = "SecurePass123!"
-            hashed, salt = self.hash_password(default_password)
-            self.users = {
-                "admin": {
-                    "password_hash": hashed,
-                    "salt": salt.hex(),  # Store salt as hex string
-                    "failed_attempts": 0,
-                    "locked_until": None
-                }
-            }
-            self.save_user_database()
+            self.store.add("admin", self.new_user_record(default_password))
             print(f"\n[INFO] Created default admin user with password: {default_password}")
             print("[INFO] Please change this password in production!")
+        self.lockouts.load(self.store.lockout_records())
     
     def save_user_database(self):
-        """Save user database to JSON file"""
-        with open(self.user_db_file, 'w') as f:
-            json.dump(self.users, f, indent=2)
+        """Write any pending changes (the JSON store rewrites its file; SQLite writes through)"""
+        self.flush_lockouts()
+        if hasattr(self.store, "save"):
+            self.store.save()
+    
+    def flush_lockouts(self) -> int:
+        """Write changed failed-attempt counters and lockouts to the store in one batch"""
+        return self.lockouts.flush(self.store)
     
     def is_account_locked(self, username: str) -> bool:
         """
@@ -218,23 +232,8 @@ class SecureLoginSystem:
         Returns:
             True if account is locked, False otherwise
         """
-        if username not in self.users:
-            return False
-        
-        user = self.users[username]
-        if user.get("locked_until") is None:
-            return False
-        
-        # Check if lockout period has expired
-        import time
-        if time.time() < user["locked_until"]:
-            return True
-        else:
-            # Lockout expired, reset
-            user["locked_until"] = None
-            user["failed_attempts"] = 0
-            self.save_user_database()
-            return False
+        # An expired lockout is cleared (and its counter reset) by the tracker
+        return self.lockouts.is_locked(username)
     
     def record_failed_attempt(self, username: str):
         """
@@ -243,30 +242,21 @@ class SecureLoginSystem:
         Args:
             username: Username that failed to login
         """
-        import time
-        
-        if username not in self.users:
-            return
-        
-        user = self.users[username]
-        user["failed_attempts"] = user.get("failed_attempts", 0) + 1
+        failed_attempts, _ = self.lockouts.record_failure(username)
         
-        if user["failed_attempts"] >= self.max_attempts:
-            user["locked_until"] = time.time() + self.lockout_duration
+        if failed_attempts >= self.max_attempts:
             print(f"\n[SECURITY] Account locked due to {self.max_attempts} failed attempts.")
             print(f"[SECURITY] Account will be unlocked in {self.lockout_duration // 60} minutes.")
         else:
-            remaining = self.max_attempts - user["failed_attempts"]
+            remaining = self.max_attempts - failed_attempts
             print(f"\n[WARNING] Invalid credentials. {remaining} attempt(s) remaining.")
         
-        self.save_user_database()
+        self.lockouts.maybe_flush(self.store)
     
     def reset_failed_attempts(self, username: str):
         """Reset failed attempts counter after successful login"""
-        if username in self.users:
-            self.users[username]["failed_attempts"] = 0
-            self.users[username]["locked_until"] = None
-            self.save_user_database()
+        self.lockouts.reset(username)
+        self.lockouts.maybe_flush(self.store)
     
     def validate_input(self, username: str, password: str) -> Tuple[bool, str]:
         """
@@ -279,27 +269,7 @@ class SecureLoginSystem:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not username or not username.strip():
-            return False, "Username cannot be empty"
-        
-        if not password:
-            return False, "Password cannot be empty"
-        
-        if len(username) > 50:
-            return False, "Username too long (max 50 characters)"
-        
-        if len(password) < 8:
-            return False, "Password too short (minimum 8 characters)"
-        
-        if len(password) > 128:
-            return False, "Password too long (max 128 characters)"
-        
-        # Check for potentially dangerous characters
-        dangerous_chars = ['<', '>', '"', "'", '&', ';', '|', '`']
-        if any(char in username for char in dangerous_chars):
-            return False, "Username contains invalid characters"
-        
-        return True, ""
+        return self.rules.validate(username, password)
     
     def login(self, username: str, password: str) -> bool:
         """
@@ -318,28 +288,32 @@ class SecureLoginSystem:
             print(f"\n[ERROR] {error_msg}")
             return False
         
-        # Check if user exists
-        if username not in self.users:
+        # Check if user exists (one store lookup; the record is reused below)
+        user = self.store.get(username)
+        if user is None:
             print("\n[ERROR] Invalid credentials")
             # Don't reveal that user doesn't exist (security through obscurity)
             return False
         
         # Check if account is locked
         if self.is_account_locked(username):
-            import time
-            user = self.users[username]
-            locked_until = user["locked_until"]
-            remaining_time = int(locked_until - time.time())
+            remaining_time = int(self.lockouts.remaining(username))
             minutes = remaining_time // 60
             seconds = remaining_time % 60
             print(f"\n[ERROR] Account is locked. Try again in {minutes}m {seconds}s")
             return False
         
         # Verify password
-        user = self.users[username]
         salt = bytes.fromhex(user["salt"])
-        if self.verify_password(password, user["password_hash"], salt):
+        # Records without hash_params predate pluggable hashing: legacy SHA-256
+        stored_params = user.get("hash_params", {"scheme": "sha256"})
+        if self.verify_password(password, user["password_hash"], salt, stored_params):
             self.reset_failed_attempts(username)
+            if stored_params != self.hasher.params():
+                # Upgrade the stored hash to the current scheme/cost now that we know the password
+                upgraded = self.new_user_record(password)
+                self.store.update(username, password_hash=upgraded["password_hash"],
+                                  salt=upgraded["salt"], hash_params=upgraded["hash_params"])
             print("\n[SUCCESS] Login successful!")
             return True
         else:
@@ -362,21 +336,65 @@ class SecureLoginSystem:
             print(f"\n[ERROR] {error_msg}")
             return False
         
-        if username in self.users:
+        if username in self.store:
             print("\n[ERROR] Username already exists")
             return False
         
         # Hash password and store
-        hashed, salt = self.hash_password(password)
-        self.users[username] = {
-            "password_hash": hashed,
-            "salt": salt.hex(),
-            "failed_attempts": 0,
-            "locked_until": None
-        }
-        self.save_user_database()
+        self.store.add(username, self.new_user_record(password))
         print(f"\n[SUCCESS] User '{username}' registered successfully!")
         return True
+    
+    def register_many(self, pairs: Iterable[Tuple[str, str]]) -> Counter:
+        """
+        Register a batch of (username, password) pairs without printing per user
+        
+        Input is validated with one validate_many call and the new records are
+        written with a single store.add_many. Duplicate and existing usernames are rejected.
+        
+        Returns:
+            Counter of outcomes: "registered" plus one key per rejection reason
+        """
+        pairs = list(pairs)
+        outcomes = Counter()
+        records = []
+        seen = set()
+        for (username, password), (is_valid, error_msg) in zip(pairs, self.rules.validate_many(pairs)):
+            if not is_valid:
+                outcomes[error_msg] += 1
+            elif username in seen or username in self.store:
+                outcomes["Username already exists"] += 1
+            else:
+                seen.add(username)
+                records.append((username, self.new_user_record(password)))
+        self.store.add_many(records)
+        outcomes["registered"] += len(records)
+        return outcomes
+    
+    def register_users_csv(self, csv_path: str, chunk_rows: int = 10_000) -> Counter:
+        """
+        Bulk-register users from a CSV file with "username" and "password" columns
+        
+        Rows are streamed and registered chunk_rows at a time, so memory stays
+        bounded for million-row files. Hashing dominates the cost; pick the hasher accordingly.
+        
+        Returns:
+            Counter of outcomes across the whole file (see register_many)
+        """
+        outcomes = Counter()
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or not {"username", "password"} <= set(reader.fieldnames):
+                raise ValueError(f"{csv_path} needs 'username' and 'password' columns")
+            chunk = []
+            for row in reader:
+                chunk.append((row["username"] or "", row["password"] or ""))
+                if len(chunk) >= chunk_rows:
+                    outcomes += self.register_many(chunk)
+                    chunk = []
+            if chunk:
+                outcomes += self.register_many(chunk)
+        return outcomes
 
 
 # ============================================================================
@@ -417,8 +435,8 @@ def main():
             print("SECURE PRACTICES IMPLEMENTED:")
             print("="*60)
             print("""
-1. Password Hashing: Uses SHA-256 with salt for password storage
-2. No Hardcoded Credentials: Credentials stored in external JSON file
+1. Password Hashing: Uses memory-hard scrypt (or PBKDF2) with stored, upgradable cost parameters
+2. No Hardcoded Credentials: Credentials stored in an external user store (JSON or SQLite)
 3. Input Validation: Validates and sanitizes all user input
 4. Rate Limiting: Implements account lockout after failed attempts
 5. Secure Storage: Passwords never stored in plain text
@@ -437,6 +455,7 @@ def main():
             password = getpass.getpass("Enter password: ")
             
             secure_system.login(username, password)
+            secure_system.save_user_database()
         
         elif choice == "4":
             secure_system = SecureLoginSystem()
@@ -0,0 +1,145 @@
+"""
+Password Hashing Schemes for SecureLoginSystem
+Pluggable hashers with their parameters stored next to each user's hash,
+so the cost can be raised later and old hashes upgraded on the next login:
+- SHA256Hasher: the original single SHA-256 over password + salt (legacy)
+- PBKDF2Hasher: PBKDF2-HMAC-SHA256 with a tunable iteration count
+- ScryptHasher: memory-hard scrypt with tunable n, r, p
+A calibration command measures the host and picks parameters that hit a
+target verification latency (e.g. 50 ms).
+"""
+
+import argparse
+from abc import ABC, abstractmethod
+import hashlib
+import hmac
+import time
+from typing import Dict, Optional
+
+
+class PasswordHasher(ABC):
+    """Base class: subclasses set scheme and implement derive()."""
+
+    scheme = ""
+
+    def params(self) -> Dict:
+        """Parameters to store with the hash (includes the scheme name)."""
+        return {"scheme": self.scheme}
+
+    @abstractmethod
+    def derive(self, password: str, salt: bytes) -> bytes:
+        """Raw derived key for password + salt."""
+
+    def hash(self, password: str, salt: bytes) -> str:
+        return self.derive(password, salt).hex()
+
+    def verify(self, password: str, hashed_password: str, salt: bytes) -> bool:
+        # Constant-time comparison so timing does not leak matching prefixes
+        return hmac.compare_digest(self.hash(password, salt), hashed_password)
+
+
+class SHA256Hasher(PasswordHasher):
+    """Legacy scheme: one SHA-256 over password + salt (fast, so weak)."""
+
+    scheme = "sha256"
+
+    def derive(self, password: str, salt: bytes) -> bytes:
+        return hashlib.sha256(password.encode('utf-8') + salt).digest()
+
+
+class PBKDF2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256; cost grows linearly with iterations."""
+
+    scheme = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def params(self) -> Dict:
+        return {"scheme": self.scheme, "iterations": self.iterations}
+
+    def derive(self, password: str, salt: bytes) -> bytes:
+        return hashlib.pbkdf2_hmac("sha256", password.encode('utf-8'), salt, self.iterations)
+
+
+class ScryptHasher(PasswordHasher):
+    """scrypt; n (a power of two) and r set time and memory (128 * n * r bytes)."""
+
+    scheme = "scrypt"
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1, dklen: int = 32):
+        self.n, self.r, self.p, self.dklen = n, r, p, dklen
+
+    def params(self) -> Dict:
+        return {"scheme": self.scheme, "n": self.n, "r": self.r, "p": self.p, "dklen": self.dklen}
+
+    def derive(self, password: str, salt: bytes) -> bytes:
+        # maxmem must cover scrypt's 128 * n * r working set plus some headroom
+        maxmem = 128 * self.n * self.r * (self.p + 1) + 1024 * 1024
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=self.n, r=self.r,
+                              p=self.p, dklen=self.dklen, maxmem=maxmem)
+
+
+def hasher_from_params(params: Optional[Dict]) -> PasswordHasher:
+    """Rebuild the hasher a stored hash was made with (no params = legacy SHA-256)."""
+    if not params or params.get("scheme") == SHA256Hasher.scheme:
+        return SHA256Hasher()
+    options = {k: v for k, v in params.items() if k != "scheme"}
+    if params["scheme"] == PBKDF2Hasher.scheme:
+        return PBKDF2Hasher(**options)
+    if params["scheme"] == ScryptHasher.scheme:
+        return ScryptHasher(**options)
+    raise ValueError(f"Unknown password hash scheme: {params['scheme']}")
+
+
+def _time_hasher(hasher: PasswordHasher, repeat: int = 3) -> float:
+    """Best time in seconds for one hash on this host."""
+    salt = b"\x00" * 32
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hasher.derive("calibration-password", salt)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(scheme: str = "scrypt", target_ms: float = 50.0) -> PasswordHasher:
+    """
+    Return a hasher whose single verification takes about target_ms on this host.
+    scrypt doubles n (keeping r=8, p=1) until the target is reached;
+    PBKDF2 measures a probe run and scales the iteration count linearly.
+    """
+    target = target_ms / 1000.0
+    if scheme == ScryptHasher.scheme:
+        n = 2 ** 10
+        while True:
+            elapsed = _time_hasher(ScryptHasher(n=n))
+            # stop when the next doubling would overshoot more than this undershoots
+            if elapsed * 2 - target > target - elapsed or n >= 2 ** 20:
+                return ScryptHasher(n=n)
+            n *= 2
+    if scheme == PBKDF2Hasher.scheme:
+        probe = 50_000
+        elapsed = _time_hasher(PBKDF2Hasher(probe))
+        return PBKDF2Hasher(max(1000, int(probe * target / elapsed)))
+    raise ValueError(f"Cannot calibrate scheme: {scheme}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate password hashing cost for this host.")
+    parser.add_argument("--scheme", choices=[ScryptHasher.scheme, PBKDF2Hasher.scheme], default="scrypt")
+    parser.add_argument("--target-ms", type=float, default=50.0, help="Target time per verification")
+    args = parser.parse_args()
+
+    print(f"Calibrating {args.scheme} for ~{args.target_ms:.0f} ms per verification...")
+    hasher = calibrate(args.scheme, args.target_ms)
+    elapsed = _time_hasher(hasher)
+    print(f"Parameters: {hasher.params()}")
+    print(f"Measured:   {elapsed * 1000:.1f} ms per hash ({1 / elapsed:,.1f} hashes/second per core)")
+    for name, other in (("sha256 (legacy)", SHA256Hasher()), ("pbkdf2 default", PBKDF2Hasher()),
+                        ("scrypt default", ScryptHasher())):
+        print(f"  {name:<16} {1 / _time_hasher(other):>12,.1f} hashes/second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+User Store Backends for SecureLoginSystem
+Pluggable credential stores with a common interface:
+- JSONUserStore: the original users.json layout (rewrites the whole file on every change)
+- SQLiteUserStore: one row per user keyed by username, updated in place in WAL mode
+- MemoryUserStore: non-persistent dict with optional simulated latency (load testing)
+Also provides batched updates (for lockout flushes), a JSON -> SQLite
+migration and a logins-per-second benchmark.
+"""
+
+import contextlib
+from abc import ABC, abstractmethod
+import io
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+# Record fields stored as their own SQLite columns; anything else goes in "extra"
+USER_FIELDS = ("password_hash", "salt", "failed_attempts", "locked_until")
+
+
+def _copy_record(record: Dict) -> Dict:
+    """Copy a record, including nested dicts such as hash_params."""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in record.items()}
+
+
+class DuplicateUserError(ValueError):
+    """Raised by add/add_many when a username is already taken."""
+
+
+class UserStore(ABC):
+    """
+    Interface shared by the user store backends.
+    Records are plain dicts with at least the USER_FIELDS keys. get() and
+    items() always return copies: changing one never alters the store, use update().
+    """
+
+    @abstractmethod
+    def get(self, username: str) -> Optional[Dict]:
+        """Return the user's record, or None if there is no such user."""
+
+    @abstractmethod
+    def add(self, username: str, record: Dict) -> None:
+        """Insert a new user; raises DuplicateUserError if the username exists."""
+
+    @abstractmethod
+    def update(self, username: str, **fields) -> None:
+        """Change some fields of an existing user's record."""
+
+    def add_many(self, records: Iterable[Tuple[str, Dict]], overwrite: bool = False) -> None:
+        """
+        Insert (username, record) pairs. An existing username raises
+        DuplicateUserError unless overwrite=True, which replaces its record.
+        """
+        for username, record in records:
+            if overwrite and username in self:
+                self.update(username, **record)
+            else:
+                self.add(username, record)
+
+    def update_many(self, changes: Dict[str, Dict]) -> None:
+        """Apply {username: fields} updates, skipping users that no longer exist."""
+        for username, fields in changes.items():
+            if username in self:
+                self.update(username, **fields)
+
+    def lockout_records(self) -> Iterator[Tuple[str, Dict]]:
+        """Users with failed attempts or a lockout recorded."""
+        for username, record in self.items():
+            if record.get("failed_attempts") or record.get("locked_until") is not None:
+                yield username, record
+
+    def __contains__(self, username: str) -> bool:
+        return self.get(username) is not None
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of users."""
+
+    @abstractmethod
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Iterate over (username, record) pairs."""
+
+    def close(self) -> None:
+        pass
+
+
+class JSONUserStore(UserStore):
+    """
+    Whole-file JSON store (the original users.json format).
+    Every add/update rewrites the file, so each change costs O(total users).
+    """
+
+    def __init__(self, path: str = "users.json"):
+        self.path = path
+        self.users: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.users = json.load(f)
+
+    def save(self) -> None:
+        with open(self.path, 'w') as f:
+            json.dump(self.users, f, indent=2)
+
+    def get(self, username: str) -> Optional[Dict]:
+        record = self.users.get(username)
+        return _copy_record(record) if record is not None else None
+
+    def add(self, username: str, record: Dict) -> None:
+        if username in self.users:
+            raise DuplicateUserError(username)
+        self.users[username] = _copy_record(record)
+        self.save()
+
+    def update(self, username: str, **fields) -> None:
+        self.users[username].update(_copy_record(fields))
+        self.save()
+
+    def add_many(self, records: Iterable[Tuple[str, Dict]], overwrite: bool = False) -> None:
+        # One file rewrite for the whole batch; nothing is changed if any username is taken
+        batch = _collect_batch(records, self.users, overwrite)
+        self.users.update(batch)
+        self.save()
+
+    def update_many(self, changes: Dict[str, Dict]) -> None:
+        # One file rewrite for the whole batch
+        for username, fields in changes.items():
+            if username in self.users:
+                self.users[username].update(_copy_record(fields))
+        self.save()
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        for username, record in self.users.items():
+            yield username, _copy_record(record)
+
+
+class MemoryUserStore(UserStore):
+    """
+    Dict-backed store that persists nothing, for tests and load generation.
+    An optional per-call latency stands in for a remote credential database.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.users: Dict[str, Dict] = {}
+        self.latency = latency
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get(self, username: str) -> Optional[Dict]:
+        self._wait()
+        record = self.users.get(username)
+        return _copy_record(record) if record is not None else None
+
+    def add(self, username: str, record: Dict) -> None:
+        self._wait()
+        if username in self.users:
+            raise DuplicateUserError(username)
+        self.users[username] = _copy_record(record)
+
+    def add_many(self, records: Iterable[Tuple[str, Dict]], overwrite: bool = False) -> None:
+        self._wait()
+        self.users.update(_collect_batch(records, self.users, overwrite))
+
+    def update(self, username: str, **fields) -> None:
+        self._wait()
+        self.users[username].update(_copy_record(fields))
+
+    def __contains__(self, username: str) -> bool:
+        return username in self.users
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        for username, record in self.users.items():
+            yield username, _copy_record(record)
+
+
+class SQLiteUserStore(UserStore):
+    """
+    SQLite store with username as the primary key.
+    Runs in WAL mode so a failed attempt or lock reset is a single-row
+    UPDATE instead of a rewrite of the whole user database.
+    """
+
+    def __init__(self, path: str = "users.db"):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            " username TEXT PRIMARY KEY,"
+            " password_hash TEXT NOT NULL,"
+            " salt TEXT NOT NULL,"
+            " failed_attempts INTEGER NOT NULL DEFAULT 0,"
+            " locked_until REAL,"
+            " extra TEXT"
+            ") WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def _split(record: Dict) -> Tuple:
+        extra = {k: v for k, v in record.items() if k not in USER_FIELDS}
+        return (record["password_hash"], record["salt"], record.get("failed_attempts", 0),
+                record.get("locked_until"), json.dumps(extra) if extra else None)
+
+    @staticmethod
+    def _join(row: Tuple) -> Dict:
+        record = dict(zip(USER_FIELDS, row[:4]))
+        if row[4]:
+            record.update(json.loads(row[4]))
+        return record
+
+    def get(self, username: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT password_hash, salt, failed_attempts, locked_until, extra"
+            " FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return self._join(row) if row else None
+
+    def add(self, username: str, record: Dict) -> None:
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO users (username, password_hash, salt, failed_attempts, locked_until, extra)"
+                    " VALUES (?, ?, ?, ?, ?, ?)", (username,) + self._split(record)
+                )
+        except sqlite3.IntegrityError:
+            raise DuplicateUserError(username) from None
+
+    def add_many(self, records: Iterable[Tuple[str, Dict]], overwrite: bool = False) -> None:
+        """Insert (username, record) pairs in one transaction (rolled back on a duplicate)."""
+        verb = "INSERT OR REPLACE" if overwrite else "INSERT"
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    f"{verb} INTO users (username, password_hash, salt, failed_attempts, locked_until, extra)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    ((username,) + self._split(record) for username, record in records),
+                )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateUserError(str(e)) from None
+
+    def update(self, username: str, **fields) -> None:
+        columns = {k: v for k, v in fields.items() if k in USER_FIELDS}
+        extra = {k: v for k, v in fields.items() if k not in USER_FIELDS}
+        with self.conn:
+            if extra:
+                current = self.get(username) or {}
+                merged = {k: v for k, v in current.items() if k not in USER_FIELDS}
+                merged.update(extra)
+                columns["extra"] = json.dumps(merged)
+            if columns:
+                assignments = ", ".join(f"{name} = ?" for name in columns)
+                self.conn.execute(
+                    f"UPDATE users SET {assignments} WHERE username = ?",
+                    tuple(columns.values()) + (username,),
+                )
+
+    def update_many(self, changes: Dict[str, Dict]) -> None:
+        # Lockout flushes only touch column fields, so they batch into one executemany
+        if all(field in USER_FIELDS for fields in changes.values() for field in fields):
+            with self.conn:
+                for names in {tuple(fields) for fields in changes.values()}:
+                    assignments = ", ".join(f"{name} = ?" for name in names)
+                    self.conn.executemany(
+                        f"UPDATE users SET {assignments} WHERE username = ?",
+                        (tuple(fields[name] for name in names) + (username,)
+                         for username, fields in changes.items() if tuple(fields) == names),
+                    )
+        else:
+            super().update_many(changes)
+
+    def lockout_records(self) -> Iterator[Tuple[str, Dict]]:
+        for row in self.conn.execute(
+            "SELECT username, password_hash, salt, failed_attempts, locked_until, extra FROM users"
+            " WHERE failed_attempts > 0 OR locked_until IS NOT NULL"
+        ):
+            yield row[0], self._join(row[1:])
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        for row in self.conn.execute(
+            "SELECT username, password_hash, salt, failed_attempts, locked_until, extra FROM users"
+        ):
+            yield row[0], self._join(row[1:])
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _collect_batch(records: Iterable[Tuple[str, Dict]], existing: Dict, overwrite: bool) -> Dict[str, Dict]:
+    """Copy a batch of records, raising DuplicateUserError (before any change) unless overwrite is set."""
+    batch: Dict[str, Dict] = {}
+    for username, record in records:
+        if not overwrite and (username in existing or username in batch):
+            raise DuplicateUserError(username)
+        batch[username] = _copy_record(record)
+    return batch
+
+
+def open_user_store(path: str) -> UserStore:
+    """Pick a backend from the file extension (.db/.sqlite/.sqlite3 -> SQLite, else JSON)."""
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        return SQLiteUserStore(path)
+    return JSONUserStore(path)
+
+
+def migrate_json_to_sqlite(json_path: str, db_path: str) -> int:
+    """
+    Copy every user from a users.json file into a SQLite store.
+    Existing usernames in the database are overwritten. Returns the number of users copied.
+    """
+    source = JSONUserStore(json_path)
+    target = SQLiteUserStore(db_path)
+    try:
+        target.add_many(source.items(), overwrite=True)
+    finally:
+        target.close()
+    return len(source)
+
+
+def benchmark_logins(n_users: int = 1_000_000, n_logins: int = 2000, db_path: str = "bench_users.db") -> float:
+    """
+    Populate a SQLite store with n_users and time n_logins mixed
+    successful/failed logins through SecureLoginSystem.
+    Returns logins per second. The database file is removed afterwards.
+    """
+    from login_system_analysis import SecureLoginSystem
+    from password_hashing import SHA256Hasher
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    store = SQLiteUserStore(db_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        # A cheap hash keeps the measurement about the store, not the hashing cost
+        system = SecureLoginSystem(store=store, hasher=SHA256Hasher())
+    password = "BenchPass123!"
+    record = system.new_user_record(password)
+    store.add_many((f"user{i}", record) for i in range(n_users))
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(n_logins):
+            username = f"user{(i * 7919) % n_users}"
+            system.login(username, password if i % 4 else "WrongPass999!")
+        system.flush_lockouts()
+    elapsed = time.perf_counter() - start
+
+    store.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    return n_logins / elapsed
+
+
+if __name__ == "__main__":
+    import sys
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Benchmarking SQLite user store with {users:,} users...")
+    print(f"{benchmark_logins(users):,.0f} logins/second")
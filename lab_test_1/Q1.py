@@ -1,11 +1,11 @@
-def is_prime(n):
-    if n < 2: return False
-    if n % 2 == 0: return n == 2
-    i = 3
-    while i * i <= n:
-        if n % i == 0: return False
-        i += 2
-    return True
+import argparse
+import os
+import sys
+
+# The primality engine is shared with the Assignment 1 prime checker.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'AIPP course', 'Assignment 1'))
+from primality import benchmark, is_prime
 
 # Test cases generated and justified by an AI helper
 _tests = [
@@ -35,19 +35,39 @@ def _run_tests():
         for n, exp, res in failed:
             print(' n={} expected={} got={}'.format(n, exp, res))
 
+
+def _run_benchmark(repeat=2000):
+    stats = benchmark([n for n, _ in _tests], repeat)
+    print('Benchmark over {} elements:'.format(stats['elements']))
+    print(' per-element: {:,.0f} checks/s'.format(stats['scalar_per_sec']))
+    if stats['vector_per_sec'] is None:
+        print(' vectorized:  skipped (NumPy not installed)')
+    else:
+        print(' vectorized:  {:,.0f} checks/s ({:.1f}x)'.format(
+            stats['vector_per_sec'], stats['vector_per_sec'] / stats['scalar_per_sec']))
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Prime checker self-tests and interactive prompt.')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Time per-element is_prime against the vectorized path and exit')
+    args = parser.parse_args()
+
     _run_tests()
-    print('\nInteractive test: enter integers (empty line to quit).')
-    try:
-        while True:
-            s = input('n = ').strip()
-            if s == '':
-                break
-            try:
-                x = int(s)
-            except ValueError:
-                print('Please enter a valid integer.')
-                continue
-            print('{} is {}prime.'.format(x, '' if is_prime(x) else 'not '))
-    except (KeyboardInterrupt, EOFError):
-        print('\nBye')
+    if args.benchmark:
+        _run_benchmark()
+    else:
+        print('\nInteractive test: enter integers (empty line to quit).')
+        try:
+            while True:
+                s = input('n = ').strip()
+                if s == '':
+                    break
+                try:
+                    x = int(s)
+                except ValueError:
+                    print('Please enter a valid integer.')
+                    continue
+                print('{} is {}prime.'.format(x, '' if is_prime(x) else 'not '))
+        except (KeyboardInterrupt, EOFError):
+            print('\nBye')